@@ -1,12 +1,49 @@
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from dotenv import dotenv_values
 import os
 
-load_dotenv(override=True)  # Load from .env file in root
 
-ALPACA_API_KEY = os.getenv("ALPACA_API_KEY")
-ALPACA_SECRET_KEY = os.getenv("ALPACA_SECRET_KEY")
-IS_PAPER = os.getenv("IS_PAPER", "true").lower() == "true"
+@dataclass(frozen=True)
+class Credentials:
+    alpaca_api_key: Optional[str]
+    alpaca_secret_key: Optional[str]
+    is_paper: bool
+    discord_webhook_url: Optional[str]
+    discord_notifications_enabled: bool
+
+
+def _env_bool(env, name, default):
+    return env.get(name, default).lower() == "true"
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> Credentials:
+    """
+    Parse the .env file (once per process) and resolve all credentials.
+    
+    Values from .env take precedence over the process environment, without
+    being exported into os.environ.
+    """
+    dotenv = {key: value for key, value in dotenv_values().items() if value is not None}
+    env = {**os.environ, **dotenv}
+
+    return Credentials(
+        alpaca_api_key=env.get("ALPACA_API_KEY"),
+        alpaca_secret_key=env.get("ALPACA_SECRET_KEY"),
+        is_paper=_env_bool(env, "IS_PAPER", "true"),
+        discord_webhook_url=env.get("DISCORD_WEBHOOK_URL"),
+        discord_notifications_enabled=_env_bool(env, "DISCORD_NOTIFICATIONS_ENABLED", "false"),
+    )
+
+
+_credentials = _load_env()
+
+ALPACA_API_KEY = _credentials.alpaca_api_key
+ALPACA_SECRET_KEY = _credentials.alpaca_secret_key
+IS_PAPER = _credentials.is_paper
 
 # Discord webhook settings
-DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
-DISCORD_NOTIFICATIONS_ENABLED = os.getenv("DISCORD_NOTIFICATIONS_ENABLED", "false").lower() == "true"
+DISCORD_WEBHOOK_URL = _credentials.discord_webhook_url
+DISCORD_NOTIFICATIONS_ENABLED = _credentials.discord_notifications_enabled
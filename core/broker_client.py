@@ -6,10 +6,14 @@ from alpaca.data.historical.stock import StockHistoricalDataClient, StockLatestT
 from alpaca.data.requests import OptionSnapshotRequest
 from alpaca.trading.requests import GetOptionContractsRequest, MarketOrderRequest
 from alpaca.trading.enums import ContractType, AssetStatus, AssetClass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from zoneinfo import ZoneInfo
 import datetime
 
+# Maximum concurrent close_position requests during liquidation
+LIQUIDATION_WORKERS = 8
+
 class TradingClientSigned(UserAgentMixin, TradingClient):
     pass
 
@@ -95,13 +99,13 @@ class BrokerClient:
     
     def liquidate_all_positions(self):
         positions = self.get_positions()
-        to_liquidate = []
-        for p in positions:
-            if p.asset_class == AssetClass.US_OPTION:
-                self.trade_client.close_position(p.symbol)
-            else:
-                to_liquidate.append(p)
-        for p in to_liquidate:
-            self.trade_client.close_position(p.symbol)
+        options = [p.symbol for p in positions if p.asset_class == AssetClass.US_OPTION]
+        others = [p.symbol for p in positions if p.asset_class != AssetClass.US_OPTION]
+
+        # Options must be closed before the shares backing them; within each group
+        # the close requests are independent and are sent concurrently
+        with ThreadPoolExecutor(max_workers=LIQUIDATION_WORKERS) as pool:
+            for symbols in (options, others):
+                list(pool.map(self.trade_client.close_position, symbols))
 
 
@@ -1,23 +1,11 @@
 import argparse
+from functools import lru_cache
 
-def parse_args():
-    parser = argparse.ArgumentParser()
-
-    parser.add_argument(
-        "--fresh-start", 
-        action="store_true", 
-        help="Liquidate all positions before running"
-    )
-
-    parser.add_argument(
-        "--strat-log", 
-        action="store_true", 
-        help="Enable strategy JSON logging"
-    )
-
+def _add_dispatch_arguments(parser):
+    """Flags that decide which command runs (needed by every invocation)."""
     parser.add_argument(
-        "--log-level", 
-        default="INFO", 
+        "--log-level",
+        default="INFO",
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         help="Set logging level for consol/file logs"
     )
@@ -33,13 +21,33 @@ def parse_args():
         action="store_true",
         help="Test Discord webhook functionality and exit"
     )
-    
+
     parser.add_argument(
         "--continuous",
         action="store_true",
         help="Run in continuous 24/7 mode with market hours awareness"
     )
 
+    parser.add_argument(
+        "--test-market-hours",
+        action="store_true",
+        help="Test market hours checker and exit"
+    )
+
+def _add_run_arguments(parser):
+    """Flags only used when the strategy actually runs."""
+    parser.add_argument(
+        "--fresh-start",
+        action="store_true",
+        help="Liquidate all positions before running"
+    )
+
+    parser.add_argument(
+        "--strat-log",
+        action="store_true",
+        help="Enable strategy JSON logging"
+    )
+
     parser.add_argument(
         "--check-interval",
         type=int,
@@ -54,10 +62,19 @@ def parse_args():
         help="Maximum strategy executions per trading day (default: 4)"
     )
 
-    parser.add_argument(
-        "--test-market-hours",
-        action="store_true",
-        help="Test market hours checker and exit"
-    )
-    
-    return parser.parse_args()
+@lru_cache(maxsize=None)
+def _build_parser(full=True):
+    parser = argparse.ArgumentParser(add_help=full)
+    _add_dispatch_arguments(parser)
+    if full:
+        _add_run_arguments(parser)
+    return parser
+
+def parse_args(argv=None):
+    # First pass: only the dispatch flags.  The --test-* commands exit early and
+    # need nothing else, so they skip the full parser when no other flags are given.
+    args, remaining = _build_parser(full=False).parse_known_args(argv)
+    if (args.test_discord or args.test_market_hours) and not remaining:
+        return args
+
+    return _build_parser().parse_args(argv)
@@ -5,27 +5,55 @@ import time
 import datetime
 import logging
 import signal
-import sys
-from typing import Callable, Optional
+import threading
+from typing import Callable, Optional, TYPE_CHECKING
 from pathlib import Path
 
-from core.market_hours import MarketHoursChecker
-from logging.discord_notifier import DiscordNotifier
+if TYPE_CHECKING:
+    from logging.discord_notifier import DiscordNotifier
 
 logger = logging.getLogger(__name__)
 
+# Adaptive polling while the market is closed (all values in seconds)
+PRE_OPEN_WINDOW = 10 * 60    # Poll quickly within 10 minutes of the open
+PRE_OPEN_POLL = 30
+NEAR_OPEN_WINDOW = 60 * 60   # Poll every couple of minutes within an hour of the open
+NEAR_OPEN_POLL = 2 * 60
+MAX_IDLE_WAIT = 4 * 60 * 60  # Longest single wait while the market is closed
+
+STATUS_LOG_INTERVAL = 60 * 60  # Seconds between periodic status updates
+DATE_CHECK_INTERVAL = 10 * 60  # Seconds between trading-day rollover checks
+
 class ContinuousScheduler:
     """
     Manages continuous execution of the options wheel strategy with market hours awareness.
     """
     
+    __slots__ = (
+        "strategy_function",
+        "check_interval",
+        "run_at_market_open",
+        "max_runs_per_day",
+        "market_checker",
+        "discord_notifier",
+        "is_running",
+        "last_run_date",
+        "runs_today",
+        "last_market_status",
+        "shutdown_notified",
+        "last_execution_hour",
+        "_wake",
+        "_next_status_log_mono",
+        "_last_date_check_mono",
+    )
+    
     def __init__(
         self, 
         strategy_function: Callable,
         check_interval_minutes: int = 15,
         run_at_market_open: bool = True,
         max_runs_per_day: int = 4,
-        discord_notifier: Optional[DiscordNotifier] = None
+        discord_notifier: Optional["DiscordNotifier"] = None
     ):
         """
         Initialize the continuous scheduler.
@@ -35,11 +63,14 @@ class ContinuousScheduler:
             check_interval_minutes: How often to check market status (minutes)            run_at_market_open: Whether to execute immediately when market opens            max_runs_per_day: Maximum number of strategy executions per trading day
             discord_notifier: Optional Discord notifier for status updates
         """
+        # Imported here so CLI paths that never build a scheduler stay fast
+        from core.market_hours import get_checker
+        
         self.strategy_function = strategy_function
         self.check_interval = check_interval_minutes * 60  # Convert to seconds
         self.run_at_market_open = run_at_market_open
         self.max_runs_per_day = max_runs_per_day
-        self.market_checker = MarketHoursChecker()
+        self.market_checker = get_checker()
         self.discord_notifier = discord_notifier
           # State tracking
         self.is_running = False
@@ -48,6 +79,9 @@ class ContinuousScheduler:
         self.last_market_status = None
         self.shutdown_notified = False  # Track if shutdown notification was sent
         self.last_execution_hour = None  # Track last execution hour to prevent duplicates
+        self._wake = threading.Event()  # Set to interrupt the wait between checks
+        self._next_status_log_mono = 0.0  # time.monotonic() deadline for the next status update
+        self._last_date_check_mono = None  # time.monotonic() of the last trading-day check
         
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -55,11 +89,21 @@ class ContinuousScheduler:
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
         logger.info(f"Received signal {signum}. Shutting down gracefully...")
-        # Don't send notification here - let stop() handle it to prevent duplicates        self.stop()
-        sys.exit(0)
+        # Only end the loop here; start() calls stop() on its way out, which sends
+        # the shutdown notification and flushes the notifier
+        self.is_running = False
+        self._wake.set()
     
-    def _reset_daily_counter(self):
+    def _reset_daily_counter(self, now_mono: Optional[float] = None):
         """Reset the daily run counter if it's a new trading day."""
+        # The date only changes at midnight ET, so re-check at most every few minutes
+        if now_mono is None:
+            now_mono = time.monotonic()
+        if (self._last_date_check_mono is not None and
+            now_mono - self._last_date_check_mono < DATE_CHECK_INTERVAL):
+            return
+        self._last_date_check_mono = now_mono
+        
         current_date = datetime.datetime.now(self.market_checker.eastern_tz).date()
         
         if self.last_run_date != current_date:
@@ -68,10 +112,13 @@ class ContinuousScheduler:
             self.last_execution_hour = None  # Reset execution hour tracking
             logger.info(f"New trading day detected: {current_date}. Reset run counter.")
     
-    def _should_execute_strategy(self) -> tuple[bool, str]:
+    def _should_execute_strategy(self, status: dict) -> tuple[bool, str]:
         """
         Determine if the strategy should be executed now.
         
+        Args:
+            status: Current market status from market_checker.get_market_status()
+        
         Returns:
             tuple: (should_execute: bool, reason: str)
         """
@@ -80,16 +127,15 @@ class ContinuousScheduler:
             return False, f"Daily limit reached ({self.runs_today}/{self.max_runs_per_day})"
         
         # Check if options trading is allowed (market hours)
-        if not self.market_checker.can_trade_options():
+        if not status['can_trade_options']:
             return False, "Options trading not allowed (market closed)"
         
         # If we want to run at market open, check if market just opened
-        if self.run_at_market_open:
-            current_status = self.market_checker.get_market_status()
-                  # If market just opened (status changed from closed to open)
-        if (self.last_market_status and 
+        # (status changed from closed to open)
+        if (self.run_at_market_open and
+            self.last_market_status and 
             not self.last_market_status.get('is_market_open', False) and 
-            current_status['is_market_open']):
+            status['is_market_open']):
             return True, "Market just opened"
         
         # Check if we can still execute more times today
@@ -97,7 +143,7 @@ class ContinuousScheduler:
             return False, f"Daily execution limit reached ({self.runs_today}/{self.max_runs_per_day})"
         
         # Execute if market is open and we haven't hit the daily limit
-        if self.market_checker.is_market_open():
+        if status['is_market_open']:
             # For the first run of the day
             if self.runs_today == 0:
                 return True, "First run of the trading day"
@@ -165,26 +211,62 @@ class ContinuousScheduler:
     
     def _log_status_update(self):
         """Log periodic status updates."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         status = self.market_checker.get_market_status()
         
-        logger.info("="*60)
-        logger.info("CONTINUOUS SCHEDULER STATUS UPDATE")
-        logger.info("="*60)
-        logger.info(f"Current Time (ET): {status['current_time_et']}")
-        logger.info(f"Market Phase: {status['market_phase'].upper()}")
-        logger.info(f"Can Trade Options: {status['can_trade_options']}")
-        logger.info(f"Runs Today: {self.runs_today}/{self.max_runs_per_day}")
+        lines = [
+            "="*60,
+            "CONTINUOUS SCHEDULER STATUS UPDATE",
+            "="*60,
+            f"Current Time (ET): {status['current_time_et']}",
+            f"Market Phase: {status['market_phase'].upper()}",
+            f"Can Trade Options: {status['can_trade_options']}",
+            f"Runs Today: {self.runs_today}/{self.max_runs_per_day}",
+        ]
         
         if not status['can_trade_options']:
-            logger.info(f"Next Market Open: {status['next_market_open']}")
-            logger.info(f"Time Until Open: {status['time_until_market_open']}")
+            lines.append(f"Next Market Open: {status['next_market_open']}")
+            lines.append(f"Time Until Open: {status['time_until_market_open']}")
         
-        logger.info("="*60)
+        lines.append("="*60)
+        logger.info("\n".join(lines))
+    
+    def _next_wait_seconds(self, elapsed: float = 0.0) -> float:
+        """
+        Seconds to wait before the next check, adapted to the market phase.
+        
+        While the market is open the regular check interval is used (capped at the
+        close). When closed, checks get more frequent as the open approaches and the
+        scheduler otherwise sleeps until shortly before the next open.
+        
+        Args:
+            elapsed: Seconds already spent in the current cycle; taken off the check
+                interval so market-hours checks keep a fixed cadence
+        """
+        now = datetime.datetime.now(self.market_checker.utc_tz)
+        
+        if self.market_checker.is_market_open(now):
+            eastern_now = now.astimezone(self.market_checker.eastern_tz)
+            market_close = eastern_now.replace(hour=16, minute=0, second=0, microsecond=0)
+            until_close = (market_close - eastern_now).total_seconds()
+            return max(1, min(self.check_interval - elapsed, until_close))
+        
+        until_open = self.market_checker.get_time_until_market_open(now).total_seconds()
+        
+        if until_open < PRE_OPEN_WINDOW:
+            return max(1, min(PRE_OPEN_POLL, until_open))
+        if until_open < NEAR_OPEN_WINDOW:
+            return NEAR_OPEN_POLL
+        
+        # Sleep until just before the open, but never longer than the idle cap
+        return min(until_open - PRE_OPEN_WINDOW, MAX_IDLE_WAIT)
     
     def start(self):
         """Start the continuous scheduler."""
         logger.info("Starting continuous options wheel scheduler...")
-        logger.info(f"Check interval: {self.check_interval // 60} minutes")
+        logger.info(f"Check interval: {self.check_interval // 60} minutes (market hours)")
         logger.info(f"Max runs per day: {self.max_runs_per_day}")
         
         if self.discord_notifier:
@@ -196,18 +278,27 @@ class ContinuousScheduler:
             )
         
         self.is_running = True
+        self.shutdown_notified = False
+        self._wake.clear()
         self._reset_daily_counter()
         
         # Log initial market status
         self._log_status_update()
+        self._next_status_log_mono = time.monotonic() + STATUS_LOG_INTERVAL
         
         while self.is_running:
             try:
+                # Cheap monotonic clock read; datetimes are only built when actually needed
+                now_mono = cycle_start = time.monotonic()
+                
                 # Reset daily counter if needed
-                self._reset_daily_counter()
+                self._reset_daily_counter(now_mono)
+                
+                # Query market status once per iteration
+                status = self.market_checker.get_market_status()
                 
                 # Check if we should execute the strategy
-                should_execute, reason = self._should_execute_strategy()
+                should_execute, reason = self._should_execute_strategy(status)
                 
                 logger.debug(f"Execution check: {should_execute} - {reason}")
                 
@@ -216,17 +307,25 @@ class ContinuousScheduler:
                 else:
                     logger.debug(f"Skipping execution: {reason}")
                 
-                # Update market status for next iteration
-                self.last_market_status = self.market_checker.get_market_status()
+                # Keep market status for the next iteration
+                self.last_market_status = status
                 
-                # Log status update every hour (4 cycles of 15 minutes)
-                current_time = datetime.datetime.now()
-                if current_time.minute in [0, 15, 30, 45] and current_time.second < 30:
+                # Log status update every hour (re-read the clock, execution may have taken a while)
+                now_mono = time.monotonic()
+                if now_mono >= self._next_status_log_mono:
                     self._log_status_update()
+                    self._next_status_log_mono += STATUS_LOG_INTERVAL
+                    if self._next_status_log_mono <= now_mono:
+                        # Resync after a long wait instead of logging repeatedly to catch up
+                        self._next_status_log_mono = now_mono + STATUS_LOG_INTERVAL
                 
-                # Wait for the next check
-                logger.debug(f"Sleeping for {self.check_interval // 60} minutes...")
-                time.sleep(self.check_interval)
+                # Sleep once until an absolute deadline (returns early if stop() is called);
+                # time spent executing this cycle counts towards the check interval
+                deadline = min(now_mono + self._next_wait_seconds(now_mono - cycle_start),
+                               self._next_status_log_mono)
+                wait_seconds = max(0.0, deadline - time.monotonic())
+                logger.debug(f"Sleeping for {wait_seconds / 60:.1f} minutes...")
+                self._wake.wait(timeout=wait_seconds)
                 
             except KeyboardInterrupt:
                 logger.info("Received keyboard interrupt. Stopping scheduler...")
@@ -239,14 +338,18 @@ class ContinuousScheduler:
                         "Continuous Scheduler - Main Loop"
                     )
                 # Continue running after error
-                time.sleep(60)  # Wait 1 minute before retrying
+                self._wake.wait(timeout=60)  # Wait 1 minute before retrying
         
         self.stop()
     
     def stop(self):
         """Stop the continuous scheduler."""
-        logger.info("Stopping continuous scheduler...")
         self.is_running = False
+        self._wake.set()
+        if self.shutdown_notified:
+            return  # Already stopped (stop() called directly, then again as start() returned)
+        self.shutdown_notified = True
+        logger.info("Stopping continuous scheduler...")
         
         if self.discord_notifier:
             self.discord_notifier.send_scheduler_notification(
@@ -254,6 +357,7 @@ class ContinuousScheduler:
                 f"🛑 Options Wheel Bot stopped\n" +
                 f"📊 Runs completed today: {self.runs_today}"
             )
+            self.discord_notifier.flush(timeout=5)
 
 def create_scheduler_with_strategy(
     strategy_args,
@@ -276,8 +380,12 @@ def create_scheduler_with_strategy(
         from scripts.run_strategy import execute_strategy_once
         execute_strategy_once(strategy_args)
     
-    # Initialize Discord notifier
-    discord_notifier = DiscordNotifier()
+    # Initialize Discord notifier only when notifications are enabled
+    from config.credentials import DISCORD_NOTIFICATIONS_ENABLED
+    discord_notifier = None
+    if DISCORD_NOTIFICATIONS_ENABLED:
+        from logging.discord_notifier import DiscordNotifier
+        discord_notifier = DiscordNotifier()
     
     return ContinuousScheduler(
         strategy_function=strategy_wrapper,
@@ -1,10 +1,64 @@
+import bisect
+import itertools
+import json
 import logging
-from .strategy import filter_underlying, filter_options, score_options, select_options
-from models.contract import Contract
-import numpy as np
+import re
 
 logger = logging.getLogger(f"strategy.{__name__}")
 
+_INSUFFICIENT = "insufficient options buying power"
+_RE_REQUIRED = re.compile(r'required: ([\d,]+\.?\d*)')
+_RE_AVAILABLE = re.compile(r'available: ([\d,]+\.?\d*)')
+
+def _parse_insufficient_funds(error_str, default_required=0):
+    """
+    Extract (required, available) buying power from an insufficient funds error.
+    Falls back to (default_required, 0) if the message can't be parsed.
+    """
+    try:
+        # Parse the JSON error message
+        if error_str.startswith('{"code"'):
+            error_data = json.loads(error_str)
+            required = float(error_data.get("required_options_buying_power", 0))
+            available = float(error_data.get("options_buying_power", 0))
+        else:
+            # Fallback to regex parsing
+            required_match = _RE_REQUIRED.search(error_str)
+            available_match = _RE_AVAILABLE.search(error_str)
+            required = float(required_match.group(1).replace(',', '')) if required_match else 0
+            available = float(available_match.group(1).replace(',', '')) if available_match else 0
+        return required, available
+    except (json.JSONDecodeError, ValueError, AttributeError):
+        return default_required, 0
+
+def _is_insufficient_funds(error_str):
+    """Check whether an order error is an insufficient options buying power error."""
+    # Broker messages are normally lowercase already, so try the exact match before lowercasing
+    return _INSUFFICIENT in error_str or _INSUFFICIENT in error_str.lower()
+
+def _notify_insufficient_funds(discord_notifier, symbol, error_str, default_required=0):
+    """Send the insufficient funds notification with amounts parsed from the error."""
+    if not discord_notifier:
+        return
+    required, available = _parse_insufficient_funds(error_str, default_required)
+    discord_notifier.send_insufficient_funds_notification(
+        symbol=symbol,
+        required_amount=required,
+        available_amount=available
+    )
+
+def _contracts_with_snapshots(contracts_by_symbol, snapshots):
+    """
+    Yield a Contract for each snapshot returned, joined to its option contract by symbol.
+    Driving the loop from the snapshots skips contracts that have no snapshot data.
+    """
+    from models.contract import Contract
+
+    for symbol, snapshot in snapshots.items():
+        contract = contracts_by_symbol.get(symbol)
+        if contract is not None and snapshot:
+            yield Contract.from_contract_snapshot(contract, snapshot)
+
 def sell_puts(client, allowed_symbols, buying_power, strat_logger=None, discord_notifier=None, trades_summary=None):
     """
     Scan allowed symbols and sell short puts up to the buying power limit.
@@ -12,6 +66,9 @@ def sell_puts(client, allowed_symbols, buying_power, strat_logger=None, discord_
     if not allowed_symbols or buying_power <= 0:
         return
 
+    # Strategy code is imported on use so importing this module stays cheap
+    from .strategy import filter_underlying, filter_options, score_options, select_options
+
     logger.info("Searching for put options...")
     filtered_symbols = filter_underlying(client, allowed_symbols, buying_power)
     if strat_logger:
@@ -20,8 +77,9 @@ def sell_puts(client, allowed_symbols, buying_power, strat_logger=None, discord_
         logger.info("No symbols found with sufficient buying power.")
         return
     option_contracts = client.get_options_contracts(filtered_symbols, 'put')
-    snapshots = client.get_option_snapshot([c.symbol for c in option_contracts])
-    put_options = filter_options([Contract.from_contract_snapshot(contract, snapshots.get(contract.symbol, None)) for contract in option_contracts if snapshots.get(contract.symbol, None)])
+    contracts_by_symbol = {c.symbol: c for c in option_contracts}
+    snapshots = client.get_option_snapshot(list(contracts_by_symbol))
+    put_options = filter_options(list(_contracts_with_snapshots(contracts_by_symbol, snapshots)))
     if strat_logger:
         strat_logger.log_put_options([p.to_dict() for p in put_options])
     
@@ -30,11 +88,11 @@ def sell_puts(client, allowed_symbols, buying_power, strat_logger=None, discord_
         scores = score_options(put_options)
         put_options = select_options(put_options, scores)
         
+        # Keep only the puts whose cumulative collateral fits in the buying power
+        cumulative_cost = list(itertools.accumulate(100 * p.strike for p in put_options))
+        put_options = put_options[:bisect.bisect_right(cumulative_cost, buying_power)]
+        
         for p in put_options:
-            buying_power -= 100 * p.strike 
-            if buying_power < 0:
-                break
-            
             try:
                 logger.info(f"Selling put: {p.symbol}")
                 client.market_sell(p.symbol)
@@ -63,39 +121,11 @@ def sell_puts(client, allowed_symbols, buying_power, strat_logger=None, discord_
                 logger.warning(f"Failed to sell put for {p.underlying}: {error_str}")
                 
                 # Check if it's an insufficient funds error
-                if "insufficient options buying power" in error_str.lower():
+                if _is_insufficient_funds(error_str):
                     logger.info(f"Insufficient buying power for {p.underlying}, skipping and continuing with next symbol...")
                     
-                    # Send specific insufficient funds notification
-                    if discord_notifier:
-                        # Try to extract amounts from error message
-                        import re
-                        import json
-                        try:
-                            # Parse the JSON error message
-                            if error_str.startswith('{"code"'):
-                                error_data = json.loads(error_str)
-                                required = float(error_data.get("required_options_buying_power", 0))
-                                available = float(error_data.get("options_buying_power", 0))
-                            else:
-                                # Fallback to regex parsing
-                                required_match = re.search(r'required: ([\d,]+\.?\d*)', error_str)
-                                available_match = re.search(r'available: ([\d,]+\.?\d*)', error_str)
-                                required = float(required_match.group(1).replace(',', '')) if required_match else 0
-                                available = float(available_match.group(1).replace(',', '')) if available_match else 0
-                            
-                            discord_notifier.send_insufficient_funds_notification(
-                                symbol=p.underlying,
-                                required_amount=required,
-                                available_amount=available
-                            )
-                        except (json.JSONDecodeError, ValueError, AttributeError):
-                            # Fallback notification if parsing fails
-                            discord_notifier.send_insufficient_funds_notification(
-                                symbol=p.underlying,
-                                required_amount=100 * p.strike,  # Estimated required amount
-                                available_amount=0  # Unknown available amount
-                            )
+                    # Send specific insufficient funds notification (estimate required amount if unparseable)
+                    _notify_insufficient_funds(discord_notifier, p.underlying, error_str, default_required=100 * p.strike)
                     
                     # Continue to next symbol instead of breaking
                     continue
@@ -111,7 +141,7 @@ def sell_puts(client, allowed_symbols, buying_power, strat_logger=None, discord_
     else:
         logger.info("No put options found with sufficient delta and open interest.")
 
-def sell_calls(client, symbol, purchase_price, stock_qty, strat_logger=None, discord_notifier=None):
+def sell_calls(client, symbol, purchase_price, stock_qty, strat_logger=None, discord_notifier=None, trades_summary=None):
     """
     Select and sell covered calls.
     """
@@ -122,6 +152,9 @@ def sell_calls(client, symbol, purchase_price, stock_qty, strat_logger=None, dis
             discord_notifier.send_error_notification(msg, f"Insufficient shares for {symbol}")
         raise ValueError(msg)
 
+    from .strategy import filter_options, score_options
+    from models.contract import Contract
+
     logger.info(f"Searching for call options on {symbol}...")
     call_options = filter_options([Contract.from_contract(option, client) for option in client.get_options_contracts([symbol], 'call')], purchase_price)    
     if strat_logger:
@@ -129,7 +162,7 @@ def sell_calls(client, symbol, purchase_price, stock_qty, strat_logger=None, dis
 
     if call_options:
         scores = score_options(call_options)
-        contract = call_options[np.argmax(scores)]
+        contract = call_options[max(range(len(scores)), key=scores.__getitem__)]
         
         try:
             logger.info(f"Selling call option: {contract.symbol}")
@@ -146,6 +179,11 @@ def sell_calls(client, symbol, purchase_price, stock_qty, strat_logger=None, dis
                     expiry=f"{contract.dte} days"
                 )
             
+            # Update trades summary for successful trade
+            if trades_summary:
+                trades_summary["calls_sold"] += 1
+                trades_summary["total_premium"] += contract.bid_price or 0
+            
             if strat_logger:
                 strat_logger.log_sold_calls(contract.to_dict())
                 
@@ -154,35 +192,9 @@ def sell_calls(client, symbol, purchase_price, stock_qty, strat_logger=None, dis
             logger.error(f"Failed to sell call for {symbol}: {error_str}")
             
             # Check if it's an insufficient funds error  
-            if "insufficient options buying power" in error_str.lower():
+            if _is_insufficient_funds(error_str):
                 logger.info(f"Insufficient buying power for {symbol} call, skipping...")
-                
-                if discord_notifier:
-                    # Try to extract amounts from error message
-                    import re
-                    import json
-                    try:
-                        if error_str.startswith('{"code"'):
-                            error_data = json.loads(error_str)
-                            required = float(error_data.get("required_options_buying_power", 0))
-                            available = float(error_data.get("options_buying_power", 0))
-                        else:
-                            required_match = re.search(r'required: ([\d,]+\.?\d*)', error_str)
-                            available_match = re.search(r'available: ([\d,]+\.?\d*)', error_str)
-                            required = float(required_match.group(1).replace(',', '')) if required_match else 0
-                            available = float(available_match.group(1).replace(',', '')) if available_match else 0
-                        
-                        discord_notifier.send_insufficient_funds_notification(
-                            symbol=symbol,
-                            required_amount=required,
-                            available_amount=available
-                        )
-                    except (json.JSONDecodeError, ValueError, AttributeError):
-                        discord_notifier.send_insufficient_funds_notification(
-                            symbol=symbol,
-                            required_amount=0,  # Unknown required amount
-                            available_amount=0  # Unknown available amount
-                        )
+                _notify_insufficient_funds(discord_notifier, symbol, error_str)
             else:
                 # For other types of errors, send regular error notification
                 if discord_notifier:
@@ -1,15 +1,20 @@
 """
 Market hours validation and trading schedule utilities.
 """
+import bisect
+import calendar
 import datetime
-import pytz
-from typing import Dict, Optional, Tuple
+import functools
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 import logging
 
 logger = logging.getLogger(__name__)
 
 # US Market holidays (simplified list - can be expanded)
-US_MARKET_HOLIDAYS_2024 = [
+US_MARKET_HOLIDAYS_2024 = (
     datetime.date(2024, 1, 1),   # New Year's Day
     datetime.date(2024, 1, 15),  # Martin Luther King Jr. Day
     datetime.date(2024, 2, 19),  # Presidents Day
@@ -20,9 +25,9 @@ US_MARKET_HOLIDAYS_2024 = [
     datetime.date(2024, 9, 2),   # Labor Day
     datetime.date(2024, 11, 28), # Thanksgiving
     datetime.date(2024, 12, 25), # Christmas
-]
+)
 
-US_MARKET_HOLIDAYS_2025 = [
+US_MARKET_HOLIDAYS_2025 = (
     datetime.date(2025, 1, 1),   # New Year's Day
     datetime.date(2025, 1, 20),  # Martin Luther King Jr. Day
     datetime.date(2025, 2, 17),  # Presidents Day
@@ -33,17 +38,186 @@ US_MARKET_HOLIDAYS_2025 = [
     datetime.date(2025, 9, 1),   # Labor Day
     datetime.date(2025, 11, 27), # Thanksgiving
     datetime.date(2025, 12, 25), # Christmas
-]
+)
 
-ALL_HOLIDAYS = US_MARKET_HOLIDAYS_2024 + US_MARKET_HOLIDAYS_2025
+# Frozenset for O(1) membership checks
+ALL_HOLIDAYS = frozenset((*US_MARKET_HOLIDAYS_2024, *US_MARKET_HOLIDAYS_2025))
+
+def _build_holiday_masks() -> Dict[int, int]:
+    """Per-year bitsets of holidays, bit N set for day-of-year N."""
+    masks = {}
+    for holiday in ALL_HOLIDAYS:
+        masks[holiday.year] = masks.get(holiday.year, 0) | 1 << holiday.timetuple().tm_yday
+    return masks
+
+_HOLIDAY_MASKS = _build_holiday_masks()
+
+def _is_holiday(day: datetime.date) -> bool:
+    """Holiday check as a single bit test against the year's mask."""
+    return (_HOLIDAY_MASKS.get(day.year, 0) >> day.timetuple().tm_yday) & 1 == 1
+
+# How long (seconds) a get_market_status() result for "now" is reused. Buckets are
+# aligned to whole minutes, the granularity at which the market phase can change,
+# so only the clock strings in a cached status can lag (by under a minute)
+STATUS_CACHE_TTL = 60
+
+# Timezones are resolved once at import and shared by all checkers
+_EASTERN = ZoneInfo('US/Eastern')
+_UTC = datetime.timezone.utc
+
+# Session boundaries as minutes after midnight ET
+_PRE_OPEN_MIN = 4 * 60          # 4:00 AM
+_REG_OPEN_MIN = 9 * 60 + 30     # 9:30 AM
+_REG_CLOSE_MIN = 16 * 60        # 4:00 PM
+_AH_CLOSE_MIN = 20 * 60         # 8:00 PM
+
+_MARKET_OPEN_TIME = datetime.time(9, 30)
+
+def _build_trading_days():
+    """Sorted trading days (weekdays that aren't holidays) for the years in the holiday calendar."""
+    years = sorted({d.year for d in ALL_HOLIDAYS})
+    day = datetime.date(years[0], 1, 1)
+    last = datetime.date(years[-1], 12, 31)
+    trading_days = []
+    while day <= last:
+        if day.weekday() < 5 and not _is_holiday(day):
+            trading_days.append(day)
+        day += datetime.timedelta(days=1)
+    return tuple(trading_days)
+
+_TRADING_DAYS = _build_trading_days()
+
+def _build_sessions() -> List[Tuple[float, float]]:
+    """(open, close) UTC epoch seconds of the regular session for every trading day."""
+    sessions = []
+    for day in _TRADING_DAYS:
+        midnight = datetime.datetime.combine(day, datetime.time(), tzinfo=_EASTERN)
+        sessions.append((
+            (midnight + datetime.timedelta(minutes=_REG_OPEN_MIN)).timestamp(),
+            (midnight + datetime.timedelta(minutes=_REG_CLOSE_MIN)).timestamp(),
+        ))
+    return sessions
+
+_SESSIONS = _build_sessions()
+
+# Epoch range covered by _SESSIONS (midnight ET of the first day to midnight after the last)
+_SESSIONS_START = datetime.datetime.combine(
+    datetime.date(_TRADING_DAYS[0].year, 1, 1), datetime.time(), tzinfo=_EASTERN).timestamp()
+_SESSIONS_END = datetime.datetime.combine(
+    datetime.date(_TRADING_DAYS[-1].year + 1, 1, 1), datetime.time(), tzinfo=_EASTERN).timestamp()
+
+def _next_trading_day(day: datetime.date, include_day: bool) -> datetime.date:
+    """
+    First trading day on or after `day` (strictly after if include_day is False).
+    """
+    if _TRADING_DAYS[0] <= day < _TRADING_DAYS[-1]:
+        find = bisect.bisect_left if include_day else bisect.bisect_right
+        return _TRADING_DAYS[find(_TRADING_DAYS, day)]
+    
+    # Outside the holiday calendar, step forward past weekends
+    candidate = day if include_day else day + datetime.timedelta(days=1)
+    while candidate.weekday() >= 5 or _is_holiday(candidate):
+        candidate += datetime.timedelta(days=1)
+    return candidate
+
+def _elapsed(later: datetime.datetime, earlier: datetime.datetime) -> datetime.timedelta:
+    """
+    Real time between two aware datetimes.
+    
+    Subtracting datetimes that share a ZoneInfo tzinfo gives wall-clock time,
+    which is an hour off across a DST change, so subtract in UTC instead.
+    """
+    return later.astimezone(_UTC) - earlier.astimezone(_UTC)
+
+@functools.lru_cache(maxsize=1024)
+def _classify(epoch_minute: int) -> str:
+    """
+    Classify a minute (minutes since the Unix epoch) into a market phase.
+    
+    Returns:
+        str: 'regular_hours', 'premarket', 'afterhours' or 'closed'
+    """
+    eastern_dt = datetime.datetime.fromtimestamp(epoch_minute * 60, _EASTERN)
+    
+    # Weekends (Saturday = 5, Sunday = 6) and holidays are closed all day
+    if eastern_dt.weekday() >= 5 or _is_holiday(eastern_dt.date()):
+        return 'closed'
+    
+    minute_of_day = eastern_dt.hour * 60 + eastern_dt.minute
+    
+    if _REG_OPEN_MIN <= minute_of_day < _REG_CLOSE_MIN:
+        return 'regular_hours'
+    if _PRE_OPEN_MIN <= minute_of_day < _REG_OPEN_MIN:
+        return 'premarket'
+    if _REG_CLOSE_MIN <= minute_of_day < _AH_CLOSE_MIN:
+        return 'afterhours'
+    return 'closed'
+
+def _dst_transitions(first_year: int, last_year: int) -> list:
+    """
+    UTC epochs at which US Eastern time enters and leaves DST (post-2007 rules),
+    in ascending order: [start, end, start, end, ...].
+    """
+    transitions = []
+    for year in range(first_year, last_year + 1):
+        march_1 = datetime.date(year, 3, 1)
+        november_1 = datetime.date(year, 11, 1)
+        dst_start = march_1 + datetime.timedelta(days=(6 - march_1.weekday()) % 7 + 7)  # 2nd Sunday
+        dst_end = november_1 + datetime.timedelta(days=(6 - november_1.weekday()) % 7)   # 1st Sunday
+        # Both switches happen at 2:00 AM local time
+        transitions.append(calendar.timegm(dst_start.timetuple()) + 7 * 3600)
+        transitions.append(calendar.timegm(dst_end.timetuple()) + 6 * 3600)
+    return transitions
+
+def is_market_open_batch(utc_timestamps):
+    """
+    Vectorized is_market_open() for arrays of UTC epoch seconds (e.g. backtests).
+    
+    Args:
+        utc_timestamps: Array-like of Unix timestamps in seconds
+        
+    Returns:
+        numpy.ndarray: Boolean mask, True where the regular session is open
+    """
+    import numpy as np  # only needed for bulk checks, keep it off the live import path
+    
+    ts = np.floor(np.asarray(utc_timestamps, dtype=np.float64)).astype(np.int64)
+    if ts.size == 0:
+        return np.zeros(ts.shape, dtype=bool)
+    
+    # Shift to Eastern wall-clock seconds using the DST transitions covering the input
+    first_year = datetime.datetime.fromtimestamp(int(ts.min()), datetime.timezone.utc).year - 1
+    last_year = datetime.datetime.fromtimestamp(int(ts.max()), datetime.timezone.utc).year + 1
+    transitions = np.array(_dst_transitions(first_year, last_year), dtype=np.int64)
+    in_dst = np.searchsorted(transitions, ts, side='right') % 2 == 1
+    local = ts + np.where(in_dst, -4 * 3600, -5 * 3600)
+    
+    day = local // 86400
+    weekday = (day + 3) % 7  # 1970-01-01 was a Thursday; Monday = 0
+    minute_of_day = (local % 86400) // 60
+    
+    epoch_ordinal = datetime.date(1970, 1, 1).toordinal()
+    holidays = np.array(sorted(d.toordinal() - epoch_ordinal for d in ALL_HOLIDAYS), dtype=np.int64)
+    
+    return ((weekday < 5)
+            & ~np.isin(day, holidays)
+            & (minute_of_day >= _REG_OPEN_MIN)
+            & (minute_of_day < _REG_CLOSE_MIN))
 
 class MarketHoursChecker:
     """Check if markets are open and provide market schedule information."""
     
     def __init__(self):
-        self.eastern_tz = pytz.timezone('US/Eastern')
-        self.utc_tz = pytz.UTC
+        self.eastern_tz = _EASTERN
+        self.utc_tz = _UTC
+        self._status_cache = None  # (time bucket, status dict) for the current time
         
+    def _market_phase(self, dt: Optional[datetime.datetime] = None) -> str:
+        """Market phase for a datetime (current time if None); cached per minute."""
+        if dt is None:
+            dt = datetime.datetime.now(self.utc_tz)
+        return _classify(int(dt.timestamp() // 60))
+    
     def is_market_open(self, dt: Optional[datetime.datetime] = None) -> bool:
         """
         Check if the market is currently open.
@@ -54,25 +228,13 @@ class MarketHoursChecker:
         Returns:
             bool: True if market is open, False otherwise
         """
-        if dt is None:
-            dt = datetime.datetime.now(self.utc_tz)
+        ts = time.time() if dt is None else dt.timestamp()
+        if not _SESSIONS_START <= ts < _SESSIONS_END:
+            return _classify(int(ts // 60)) == 'regular_hours'
         
-        # Convert to Eastern Time
-        eastern_dt = dt.astimezone(self.eastern_tz)
-        
-        # Check if it's a weekend
-        if eastern_dt.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
-            
-        # Check if it's a holiday
-        if eastern_dt.date() in ALL_HOLIDAYS:
-            return False
-            
-        # Regular market hours: 9:30 AM - 4:00 PM ET
-        market_open = eastern_dt.replace(hour=9, minute=30, second=0, microsecond=0)
-        market_close = eastern_dt.replace(hour=16, minute=0, second=0, microsecond=0)
-        
-        return market_open <= eastern_dt < market_close
+        # Last session opening at or before ts; open if ts falls before its close
+        i = bisect.bisect_right(_SESSIONS, (ts, math.inf)) - 1
+        return i >= 0 and _SESSIONS[i][0] <= ts < _SESSIONS[i][1]
     
     def is_premarket_open(self, dt: Optional[datetime.datetime] = None) -> bool:
         """
@@ -84,24 +246,7 @@ class MarketHoursChecker:
         Returns:
             bool: True if pre-market is open, False otherwise
         """
-        if dt is None:
-            dt = datetime.datetime.now(self.utc_tz)
-        
-        eastern_dt = dt.astimezone(self.eastern_tz)
-        
-        # Check if it's a weekend
-        if eastern_dt.weekday() >= 5:
-            return False
-            
-        # Check if it's a holiday
-        if eastern_dt.date() in ALL_HOLIDAYS:
-            return False
-            
-        # Pre-market hours: 4:00 AM - 9:30 AM ET
-        premarket_open = eastern_dt.replace(hour=4, minute=0, second=0, microsecond=0)
-        market_open = eastern_dt.replace(hour=9, minute=30, second=0, microsecond=0)
-        
-        return premarket_open <= eastern_dt < market_open
+        return self._market_phase(dt) == 'premarket'
     
     def is_afterhours_open(self, dt: Optional[datetime.datetime] = None) -> bool:
         """
@@ -113,24 +258,7 @@ class MarketHoursChecker:
         Returns:
             bool: True if after-hours is open, False otherwise
         """
-        if dt is None:
-            dt = datetime.datetime.now(self.utc_tz)
-        
-        eastern_dt = dt.astimezone(self.eastern_tz)
-        
-        # Check if it's a weekend
-        if eastern_dt.weekday() >= 5:
-            return False
-            
-        # Check if it's a holiday
-        if eastern_dt.date() in ALL_HOLIDAYS:
-            return False
-            
-        # After-hours: 4:00 PM - 8:00 PM ET
-        market_close = eastern_dt.replace(hour=16, minute=0, second=0, microsecond=0)
-        afterhours_close = eastern_dt.replace(hour=20, minute=0, second=0, microsecond=0)
-        
-        return market_close <= eastern_dt < afterhours_close
+        return self._market_phase(dt) == 'afterhours'
     
     def can_trade_options(self, dt: Optional[datetime.datetime] = None) -> bool:
         """
@@ -158,38 +286,15 @@ class MarketHoursChecker:
         if dt is None:
             dt = datetime.datetime.now(self.utc_tz)
         
-        eastern_dt = dt.astimezone(self.eastern_tz)
-        
-        # Start with today's market open
-        next_open = eastern_dt.replace(hour=9, minute=30, second=0, microsecond=0)
-        
-        # If market hasn't opened today, return today's open time
-        if eastern_dt < next_open and eastern_dt.weekday() < 5 and eastern_dt.date() not in ALL_HOLIDAYS:
-            return next_open
-        
-        # Otherwise, find the next business day
-        days_ahead = 1
-        while True:
-            candidate_date = eastern_dt.date() + datetime.timedelta(days=days_ahead)
-            candidate_dt = eastern_dt.replace(
-                year=candidate_date.year,
-                month=candidate_date.month,
-                day=candidate_date.day,
-                hour=9,
-                minute=30,
-                second=0,
-                microsecond=0
-            )
-            
-            # Check if it's not a weekend or holiday
-            if candidate_dt.weekday() < 5 and candidate_date not in ALL_HOLIDAYS:
-                return candidate_dt
-            
-            days_ahead += 1
-            if days_ahead > 10:  # Safety check
-                break
+        return self._next_open_from_eastern(dt.astimezone(self.eastern_tz))
+    
+    def _next_open_from_eastern(self, eastern_dt: datetime.datetime) -> datetime.datetime:
+        """Next market open for a datetime already converted to Eastern time."""
+        # Today's open counts if it hasn't happened yet, otherwise look from tomorrow
+        before_open = eastern_dt.hour * 60 + eastern_dt.minute < _REG_OPEN_MIN
+        next_date = _next_trading_day(eastern_dt.date(), include_day=before_open)
         
-        return next_open  # Fallback
+        return datetime.datetime.combine(next_date, _MARKET_OPEN_TIME, tzinfo=self.eastern_tz)
     
     def get_time_until_market_open(self, dt: Optional[datetime.datetime] = None) -> datetime.timedelta:
         """
@@ -204,10 +309,9 @@ class MarketHoursChecker:
         if dt is None:
             dt = datetime.datetime.now(self.utc_tz)
         
-        next_open = self.get_next_market_open(dt)
         eastern_dt = dt.astimezone(self.eastern_tz)
         
-        return next_open - eastern_dt
+        return _elapsed(self._next_open_from_eastern(eastern_dt), eastern_dt)
     
     def get_market_status(self, dt: Optional[datetime.datetime] = None) -> Dict[str, any]:
         """
@@ -219,36 +323,49 @@ class MarketHoursChecker:
         Returns:
             dict: Market status information
         """
-        if dt is None:
-            dt = datetime.datetime.now(self.utc_tz)
+        if dt is not None:
+            return self._compute_market_status(dt)
         
+        # Reuse the status for "now" within the same TTL bucket
+        bucket = int(time.time() // STATUS_CACHE_TTL)
+        if self._status_cache is None or self._status_cache[0] != bucket:
+            self._status_cache = (bucket, self._compute_market_status(datetime.datetime.now(self.utc_tz)))
+        
+        return dict(self._status_cache[1])
+    
+    def _compute_market_status(self, dt: datetime.datetime) -> Dict[str, any]:
+        """Build the market status dictionary for the given datetime."""
         eastern_dt = dt.astimezone(self.eastern_tz)
         
+        market_phase = self._market_phase(dt)
+        next_open = self._next_open_from_eastern(eastern_dt)
+        
         status = {
             'current_time_et': eastern_dt.strftime('%Y-%m-%d %H:%M:%S %Z'),
-            'is_trading_day': eastern_dt.weekday() < 5 and eastern_dt.date() not in ALL_HOLIDAYS,
-            'is_market_open': self.is_market_open(dt),
-            'is_premarket_open': self.is_premarket_open(dt),
-            'is_afterhours_open': self.is_afterhours_open(dt),
-            'can_trade_options': self.can_trade_options(dt),
-            'next_market_open': self.get_next_market_open(dt).strftime('%Y-%m-%d %H:%M:%S %Z'),
-            'time_until_market_open': str(self.get_time_until_market_open(dt))
+            'is_trading_day': eastern_dt.weekday() < 5 and not _is_holiday(eastern_dt.date()),
+            'is_market_open': market_phase == 'regular_hours',
+            'is_premarket_open': market_phase == 'premarket',
+            'is_afterhours_open': market_phase == 'afterhours',
+            'can_trade_options': market_phase == 'regular_hours',
+            'next_market_open': next_open.strftime('%Y-%m-%d %H:%M:%S %Z'),
+            'time_until_market_open': str(_elapsed(next_open, eastern_dt)),
+            'market_phase': market_phase
         }
         
-        if status['is_market_open']:
-            status['market_phase'] = 'regular_hours'
-        elif status['is_premarket_open']:
-            status['market_phase'] = 'premarket'
-        elif status['is_afterhours_open']:
-            status['market_phase'] = 'afterhours'
-        else:
-            status['market_phase'] = 'closed'
-        
         return status
 
+_checker = None
+
+def get_checker() -> MarketHoursChecker:
+    """Return the shared MarketHoursChecker instance."""
+    global _checker
+    if _checker is None:
+        _checker = MarketHoursChecker()
+    return _checker
+
 def log_market_status():
     """Log current market status information."""
-    checker = MarketHoursChecker()
+    checker = get_checker()
     status = checker.get_market_status()
     
     logger.info(f"Market Status at {status['current_time_et']}")
@@ -1,6 +1,7 @@
 import re
-import pytz
+import time
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
 def parse_option_symbol(symbol):
     """
@@ -21,6 +22,26 @@ def parse_option_symbol(symbol):
         raise ValueError(f"Invalid option symbol format: {symbol}")
 
 def get_ny_timestamp():
-    ny_tz = pytz.timezone("America/New_York")
+    ny_tz = ZoneInfo("America/New_York")
     ny_time = datetime.now(ny_tz)
-    return ny_time.isoformat()
\ No newline at end of file
+    return ny_time.isoformat()
+
+# tz -> (epoch second, ISO string) of the last timestamp formatted by now_iso()
+_iso_cache = {}
+
+def now_iso(tz=None):
+    """
+    Current time as an ISO 8601 string, formatted at most once per second per timezone.
+
+    Args:
+        tz: Timezone to format in; local time if None
+
+    Returns:
+        str: Timestamp with whole-second precision
+    """
+    second = int(time.time())
+    cached = _iso_cache.get(tz)
+    if cached is None or cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second, tz).isoformat())
+        _iso_cache[tz] = cached
+    return cached[1]
@@ -1,23 +1,373 @@
+import atexit
 import json
+import math
+from contextlib import contextmanager
+import queue
+import threading
+import weakref
 import requests
 import logging
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Optional
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config.credentials import DISCORD_WEBHOOK_URL, DISCORD_NOTIFICATIONS_ENABLED
+from core.utils import now_iso
+
+# orjson is optional; it serializes embed payloads faster than the stdlib encoder
+try:
+    import orjson
+
+    def _dumps(payload):
+        return orjson.dumps(payload)
+except ImportError:
+    def _dumps(payload):
+        return json.dumps(payload).encode("utf-8")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_UTC = timezone.utc
+
+# Trade type -> (emoji, action, color)
+_TRADE_META = MappingProxyType({
+    "PUT": ("📉", "Sold Put", 0xf39c12),    # Orange
+    "CALL": ("📈", "Sold Call", 0xe74c3c),  # Red
+})
+
+# Trade embed body, filled in with a single format() call per trade
+_TRADE_TEMPLATE = (
+    "**{emoji} {action} Executed**\n\n"
+    "**Underlying:** {symbol}\n"
+    "**Contract:** {contract}\n"
+    "**Strike:** ${strike}\n"
+    "**Premium Collected:** ${premium:.2f}\n"
+    "**Expiry:** {expiry}\n"
+)
+
+# Insufficient funds embed body
+_INSUFFICIENT_FUNDS_TEMPLATE = (
+    "**🟠 Insufficient Funds - Continuing**\n\n"
+    "**Symbol:** {symbol}\n"
+    "**Required:** ${required:,.2f}\n"
+    "**Available:** ${available:,.2f}\n"
+    "**Shortfall:** ${shortfall:,.2f}\n\n"
+    "*Skipping {symbol} and continuing to check other symbols...*"
+)
+
+_SCHEDULER_COLORS = MappingProxyType({
+    'startup': 0x00ff00,      # Green
+    'execution_start': 0xf39c12,  # Orange
+    'execution_complete': 0x27ae60,  # Green
+    'shutdown': 0x95a5a6      # Gray
+})
+
+_SCHEDULER_TITLES = MappingProxyType({
+    'startup': '🤖 Scheduler Started',
+    'execution_start': '🚀 Execution Starting',
+    'execution_complete': '✅ Execution Complete',
+    'shutdown': '🛑 Scheduler Shutdown'
+})
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of notifications waiting for the background sender
+QUEUE_MAXSIZE = 256
+
+# Discord accepts up to 10 embeds and 6000 characters of embed text per webhook message
+MAX_EMBEDS_PER_POST = 10
+MAX_CHARS_PER_POST = 6000
+
+# Per-embed limits; longer text is truncated so Discord doesn't reject the whole post
+MAX_TITLE_CHARS = 256
+MAX_DESCRIPTION_CHARS = 4096
+
+# Responses meaning Discord rejected the payload itself (rather than the webhook)
+_PAYLOAD_REJECTED = frozenset({400, 413})
+
+class _WebhookRetry(Retry):
+    """urllib3 Retry that also accepts the fractional Retry-After values Discord sends on 429."""
+    
+    def parse_retry_after(self, retry_after):
+        try:
+            seconds = max(math.ceil(float(retry_after)), 0)
+        except (ValueError, OverflowError):
+            return super().parse_retry_after(retry_after)  # HTTP-date form
+        return super().parse_retry_after(str(seconds))
+
+# Retries for rate-limited (429) and server-error (5xx) responses and connection
+# errors, done by urllib3 on the pooled connection and honouring Retry-After.
+# Read errors are not retried: the webhook may already have posted the message.
+# Backoff doubles per retry (capped at 30s) plus up to 1s of random jitter.
+_WEBHOOK_RETRY = _WebhookRetry(
+    total=3,
+    read=0,
+    backoff_factor=1.0,
+    backoff_max=30.0,
+    backoff_jitter=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# One keep-alive session per webhook origin, shared by every notifier so a new
+# DiscordNotifier reuses the pooled HTTPS connection instead of handshaking again
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def _session_for(webhook_url):
+    """Return the shared session for the webhook's scheme and host, creating it on first use."""
+    url = urlsplit(webhook_url)
+    origin = f"{url.scheme}://{url.netloc}/"
+    with _sessions_lock:
+        session = _sessions.get(origin)
+        if session is None:
+            session = requests.Session()
+            session.mount(origin, HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=_WEBHOOK_RETRY))
+            if not _sessions:
+                atexit.register(_close_sessions)
+            _sessions[origin] = session
+    return session
+
+def _close_sessions():
+    """Close every shared webhook session."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+# Notifiers with a running sender thread, drained at interpreter exit
+_active_notifiers = weakref.WeakSet()
+
+def _drain_all(timeout=5):
+    """Give every live notifier a bounded chance to send queued messages."""
+    for notifier in list(_active_notifiers):
+        notifier.flush(timeout)
+
+def _chunk_embeds(embeds):
+    """Split embeds into groups that each fit in one webhook message."""
+    chunk, chars = [], 0
+    for embed in embeds:
+        size = embed.char_count()
+        if chunk and (len(chunk) == MAX_EMBEDS_PER_POST or chars + size > MAX_CHARS_PER_POST):
+            yield chunk
+            chunk, chars = [], 0
+        chunk.append(embed)
+        chars += size
+    if chunk:
+        yield chunk
+
+def _truncate(text, limit):
+    """Shorten text to at most `limit` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+def _to_float(value, default=0.0):
+    """Coerce a value to float, returning default if it can't be converted."""
+    if isinstance(value, float):
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+DEFAULT_EMBED_COLOR = 0x3498db  # Blue
+
+_EMBED_FOOTER = {"text": "Options Wheel Bot"}
+
+@dataclass
+class Embed:
+    """A single queued Discord embed; turned into the webhook payload by the sender thread."""
+    __slots__ = ("description", "color", "title", "timestamp")
+    
+    description: str
+    color: int
+    title: Optional[str]
+    timestamp: str
+    
+    def __post_init__(self):
+        self.description = _truncate(self.description, MAX_DESCRIPTION_CHARS)
+        if self.title:
+            self.title = _truncate(self.title, MAX_TITLE_CHARS)
+    
+    def char_count(self):
+        """Characters this embed counts towards Discord's per-message limit."""
+        return len(self.description) + len(self.title or "") + len(_EMBED_FOOTER["text"])
+    
+    def to_dict(self):
+        """Webhook JSON object for this embed."""
+        embed = {"description": self.description, "color": self.color,
+                 "timestamp": self.timestamp, "footer": _EMBED_FOOTER}
+        if self.title:
+            embed["title"] = self.title
+        return embed
+
 class DiscordNotifier:
-    def __init__(self, enabled=None):
+
+    def __init__(self, enabled=None, transport=None):
+        """
+        Args:
+            enabled (bool, optional): Overrides DISCORD_NOTIFICATIONS_ENABLED
+            transport (callable, optional): Called with each webhook payload (a dict)
+                instead of POSTing it, raising on failure. Lets the payloads be
+                checked without a webhook URL (dry run).
+        """
         self.enabled = enabled if enabled is not None else DISCORD_NOTIFICATIONS_ENABLED
         self.webhook_url = DISCORD_WEBHOOK_URL
+        # Truncated URL for display, so the full webhook token isn't printed
+        self.webhook_url_preview = self.webhook_url[:50] if self.webhook_url else ""
         
-        if self.enabled and not self.webhook_url:
+        if self.enabled and not self.webhook_url and transport is None:
             logger.warning("Discord notifications are enabled but no webhook URL is configured. Disabling Discord notifications.")
             self.enabled = False 
 
+        # Keep-alive session shared with other notifiers posting to the same host;
+        # a disabled notifier (or one with its own transport) never opens one
+        use_http = self.enabled and transport is None
+        self._session = _session_for(self.webhook_url) if use_http else None
+        self._transport = self._http_post if transport is None else transport
+
+        # Background delivery so webhook latency stays out of the trading loop
+        self._queue = queue.Queue(maxsize=QUEUE_MAXSIZE)
+        self._worker = None
+        self._pending = None  # Embeds collected inside a batched() block
+        
+        # Delivery failures recorded by the sender thread, read after flush()
+        self.failed_embeds = 0
+        self.last_error = None
+
+    def _ensure_worker(self):
+        """Start the background sender thread on first use."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._drain_queue, name="discord-notifier", daemon=True)
+            self._worker.start()
+            if not _active_notifiers:
+                # Registered after _close_sessions so the drain runs before sessions close
+                atexit.unregister(_drain_all)
+                atexit.register(_drain_all)
+            _active_notifiers.add(self)
+
+    def _drain_queue(self):
+        """
+        Send queued embeds in order; flush markers are threading.Events.
+        
+        Embeds already waiting in the queue are combined into a single webhook
+        post, up to Discord's per-message embed and character limits. Lists
+        queued by send_batch() are posted as their own messages.
+        """
+        carry = None  # Item taken off the queue that didn't fit the previous batch
+        while True:
+            item = carry if carry is not None else self._queue.get()
+            carry = None
+            if isinstance(item, threading.Event):
+                item.set()
+                self._queue.task_done()
+                continue
+            if isinstance(item, list):
+                for chunk in _chunk_embeds(item):
+                    self._send_embeds(chunk)
+                self._queue.task_done()
+                continue
+            
+            batch = [item]
+            chars = item.char_count()
+            while len(batch) < MAX_EMBEDS_PER_POST:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if not isinstance(nxt, Embed) or chars + nxt.char_count() > MAX_CHARS_PER_POST:
+                    carry = nxt
+                    break
+                batch.append(nxt)
+                chars += nxt.char_count()
+            
+            self._send_embeds(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _send_embeds(self, embeds):
+        """
+        Post embeds as one webhook message.
+        
+        If Discord rejects the payload, each embed is resent on its own so one
+        bad embed can't take the rest of the batch down with it.
+        """
+        error = self._post({"embeds": [embed.to_dict() for embed in embeds]})
+        if error is None:
+            return
+        
+        response = getattr(error, "response", None)
+        if len(embeds) > 1 and response is not None and response.status_code in _PAYLOAD_REJECTED:
+            logger.warning("Discord rejected a batch of %d embeds; resending them one at a time", len(embeds))
+            for embed in embeds:
+                self._send_embeds([embed])
+            return
+        
+        self.failed_embeds += len(embeds)
+        self.last_error = error
+
+    def _http_post(self, payload):
+        """
+        Default transport: POST a payload to the webhook, raising on an error response.
+        
+        Transient failures are retried by the session's adapter (see _WEBHOOK_RETRY).
+        """
+        response = self._session.post(
+            self.webhook_url,
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=10
+        )
+        response.raise_for_status()
+
+    def _post(self, payload):
+        """
+        Send a payload through the transport, logging (not raising) any failure.
+        
+        Runs on the sender thread, so retries never block the caller.
+        
+        Returns:
+            Exception or None: The failure, or None if the payload was delivered
+        """
+        try:
+            self._transport(payload)
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to send Discord notification: %s", e)
+            return e
+        except Exception as e:
+            logger.error("Unexpected error sending Discord notification: %s", e)
+            return e
+        return None
+
+    def flush(self, timeout=5):
+        """
+        Wait for queued notifications to be sent.
+        
+        Args:
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            bool: True if the queue was drained within the timeout
+        """
+        if self._worker is None or not self._worker.is_alive():
+            return True
+        
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
     def send_message(self, message, title=None, color=None):
         """
-        Send a message to Discord webhook.
+        Queue a message for the Discord webhook.
+        
+        Messages are posted in order by a background thread, so this never blocks
+        on the network. Use flush() to wait for delivery.
         
         Args:
             message (str): The message content
@@ -27,38 +377,70 @@ class DiscordNotifier:
         if not self.enabled:
             return
             
+        self.send_embed(Embed(
+            description=message,
+            color=DEFAULT_EMBED_COLOR if color is None else color,
+            title=title,
+            timestamp=now_iso(_UTC)
+        ))
+
+    def send_embed(self, embed):
+        """
+        Queue a prebuilt embed for the Discord webhook.
+        
+        Args:
+            embed (Embed): The embed to send
+        """
+        if not self.enabled:
+            return
+        
+        if self._pending is not None:
+            self._pending.append(embed)
+            return
+        
+        self._enqueue(embed)
+
+    def send_batch(self, embeds):
+        """
+        Queue several embeds to be posted together in as few webhook messages as possible.
+        
+        Args:
+            embeds (list[Embed]): Embeds to send, in order
+        """
+        if not self.enabled or not embeds:
+            return
+        
+        self._enqueue(list(embeds))
+
+    @contextmanager
+    def batched(self):
+        """
+        Collect every message sent inside the block and queue them as one batch.
+        
+        Example:
+            with notifier.batched():
+                notifier.send_startup_message(...)
+                notifier.send_completion_message(...)
+        """
+        if self._pending is not None:
+            # Already batching; the outer block sends everything
+            yield self
+            return
+        
+        self._pending = []
         try:
-            # Default colors
-            if color is None:
-                color = 0x3498db  # Blue
-                
-            embed = {
-                "description": message,
-                "color": color,
-                "timestamp": datetime.utcnow().isoformat(),
-                "footer": {
-                    "text": "Options Wheel Bot"
-                }
-            }
-            
-            if title:
-                embed["title"] = title
-                
-            payload = {
-                "embeds": [embed]
-            }
-            
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to send Discord notification: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error sending Discord notification: {e}")
+            yield self
+        finally:
+            pending, self._pending = self._pending, None
+            self.send_batch(pending)
+
+    def _enqueue(self, item):
+        """Hand an embed or list of embeds to the sender thread, dropping it if the queue is full."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.warning("Discord notification queue is full, dropping message")
 
     def send_startup_message(self, fresh_start=False, buying_power=None, allowed_symbols=None):
         """Send a message when the bot starts running."""
@@ -67,19 +449,22 @@ class DiscordNotifier:
             
         mode = "🔄 Fresh Start Mode" if fresh_start else "🏃 Regular Mode"
         
-        message = f"**Options Wheel Strategy Bot Started**\n\n"
-        message += f"**Mode:** {mode}\n"
+        parts = [
+            "**Options Wheel Strategy Bot Started**\n\n",
+            f"**Mode:** {mode}\n",
+        ]
         
         if buying_power is not None:
-            message += f"**Available Buying Power:** ${buying_power:,.2f}\n"
+            parts.append(f"**Available Buying Power:** ${buying_power:,.2f}\n")
             
         if allowed_symbols:
             symbols_text = ", ".join(allowed_symbols[:10])  # Limit to first 10 symbols
             if len(allowed_symbols) > 10:
                 symbols_text += f" (+{len(allowed_symbols) - 10} more)"
-            message += f"**Trading Symbols:** {symbols_text}\n"
+            parts.append(f"**Trading Symbols:** {symbols_text}\n")
             
-        message += f"\n*Starting strategy execution...*"
+        parts.append("\n*Starting strategy execution...*")
+        message = "".join(parts)
         
         self.send_message(message, title="🚀 Bot Started", color=0x00ff00)  # Green
 
@@ -93,54 +478,57 @@ class DiscordNotifier:
             contract_symbol (str): Full option contract symbol
             strike (float): Strike price
             premium (float): Premium collected
-            expiry (str): Expiration date        """
+            expiry (str): Expiration date
+        """
         if not self.enabled:
             return
             
-        emoji = "📉" if trade_type.upper() == "PUT" else "📈"
-        action = "Sold Put" if trade_type.upper() == "PUT" else "Sold Call"
+        self.send_embed(self.build_trade_embed(trade_type, symbol, contract_symbol, strike, premium, expiry))
+
+    @staticmethod
+    def build_trade_embed(trade_type, symbol, contract_symbol, strike, premium, expiry):
+        """
+        Build the embed for a trade execution without queueing it.
         
-        message = f"**{emoji} {action} Executed**\n\n"
-        message += f"**Underlying:** {symbol}\n"
-        message += f"**Contract:** {contract_symbol}\n"
-        message += f"**Strike:** ${strike}\n"
-        message += f"**Premium Collected:** ${premium:.2f}\n"
-        message += f"**Expiry:** {expiry}\n"
+        Args:
+            trade_type (str): 'PUT' or 'CALL'
+            symbol (str): Underlying symbol
+            contract_symbol (str): Full option contract symbol
+            strike (float): Strike price
+            premium (float): Premium collected
+            expiry (str): Expiration date
+            
+        Returns:
+            Embed: The trade embed
+        """
+        emoji, action, color = _TRADE_META.get(trade_type.upper(), _TRADE_META["CALL"])
         
-        color = 0xf39c12 if trade_type.upper() == "PUT" else 0xe74c3c  # Orange for puts, red for calls
-        self.send_message(message, color=color)
+        message = _TRADE_TEMPLATE.format(
+            emoji=emoji, action=action, symbol=symbol, contract=contract_symbol,
+            strike=strike, premium=premium, expiry=expiry
+        )
+        
+        return Embed(description=message, color=color, title=None, timestamp=now_iso(_UTC))
 
     def send_position_update(self, positions_summary):
         """Send notification about current positions."""
         if not self.enabled or not positions_summary:
             return
             
-        message = "**📊 Current Positions Update**\n\n"
+        parts = ["**📊 Current Positions Update**\n\n"]
         
         for pos in positions_summary:
-            # Safely convert pnl to float for comparison
-            try:
-                pnl_value = float(pos.get('pnl', 0))
-            except (ValueError, TypeError):
-                pnl_value = 0.0
-                
-            pnl_emoji = "📈" if pnl_value >= 0 else "📉"
+            # Safely convert values to float for comparison and formatting
+            pnl_value = _to_float(pos.get('pnl', 0))
+            purchase_price = _to_float(pos.get('purchase_price', 0))
+            current_price = _to_float(pos.get('current_price', 0))
             
-            # Safely convert other values to float for formatting
-            try:
-                purchase_price = float(pos.get('purchase_price', 0))
-            except (ValueError, TypeError):
-                purchase_price = 0.0
-                
-            try:
-                current_price = float(pos.get('current_price', 0))
-            except (ValueError, TypeError):
-                current_price = 0.0
+            pnl_emoji = "📈" if pnl_value >= 0 else "📉"
             
-            message += f"{pnl_emoji} **{pos['symbol']}**: {pos['side']} {pos['qty']} @ ${purchase_price:.2f}\n"
-            message += f"   Current: ${current_price:.2f} | P&L: ${pnl_value:.2f}\n\n"
+            parts.append(f"{pnl_emoji} **{pos['symbol']}**: {pos['side']} {pos['qty']} @ ${purchase_price:.2f}\n")
+            parts.append(f"   Current: ${current_price:.2f} | P&L: ${pnl_value:.2f}\n\n")
             
-        self.send_message(message, color=0x9b59b6)  # Purple
+        self.send_message("".join(parts), color=0x9b59b6)  # Purple
 
     def send_error_notification(self, error_message, context=None):
         """Send notification about errors."""
@@ -156,9 +544,11 @@ class DiscordNotifier:
         self.send_message(message, color=0xe74c3c)  # Red
 
     def send_completion_message(self, summary):
-        """Send message when strategy execution completes."""
+        """Send message when strategy execution completes (skipped when nothing traded)."""
         if not self.enabled:
             return
+        if not (summary.get('puts_sold') or summary.get('calls_sold') or summary.get('total_premium')):
+            return
             
         message = "**✅ Strategy Execution Completed**\n\n"
         
@@ -184,22 +574,8 @@ class DiscordNotifier:
         if not self.enabled:
             return
             
-        color_map = {
-            'startup': 0x00ff00,      # Green
-            'execution_start': 0xf39c12,  # Orange
-            'execution_complete': 0x27ae60,  # Green
-            'shutdown': 0x95a5a6      # Gray
-        }
-        
-        title_map = {
-            'startup': '🤖 Scheduler Started',
-            'execution_start': '🚀 Execution Starting',
-            'execution_complete': '✅ Execution Complete',
-            'shutdown': '🛑 Scheduler Shutdown'
-        }
-        
-        color = color_map.get(event_type, 0x3498db)  # Default blue
-        title = title_map.get(event_type, '📢 Scheduler Update')
+        color = _SCHEDULER_COLORS.get(event_type, 0x3498db)  # Default blue
+        title = _SCHEDULER_TITLES.get(event_type, '📢 Scheduler Update')
         
         self.send_message(message, title=title, color=color)
 
@@ -215,13 +591,11 @@ class DiscordNotifier:
         if not self.enabled:
             return
             
-        shortfall = required_amount - available_amount
-        
-        message = f"**🟠 Insufficient Funds - Continuing**\n\n"
-        message += f"**Symbol:** {symbol}\n"
-        message += f"**Required:** ${required_amount:,.2f}\n"
-        message += f"**Available:** ${available_amount:,.2f}\n"
-        message += f"**Shortfall:** ${shortfall:,.2f}\n\n"
-        message += f"*Skipping {symbol} and continuing to check other symbols...*"
+        message = _INSUFFICIENT_FUNDS_TEMPLATE.format(
+            symbol=symbol,
+            required=required_amount,
+            available=available_amount,
+            shortfall=required_amount - available_amount
+        )
         
         self.send_message(message, title="⚠️ Insufficient Buying Power", color=0xf39c12)  # Orange
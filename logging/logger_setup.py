@@ -2,10 +2,16 @@
 Logging setup utilities for the options wheel strategy.
 """
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from datetime import datetime
 
+# File logging: records are buffered in memory and written in batches
+LOG_BUFFER_CAPACITY = 256
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
 def setup_logger(level="INFO", to_file=False, name="strategy", session_id=None):
     """
     Set up a logger with the specified configuration.
@@ -22,7 +28,12 @@ def setup_logger(level="INFO", to_file=False, name="strategy", session_id=None):
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Clear any existing handlers
+    # Close and clear any existing handlers (flushes buffered records to their files)
+    for handler in logger.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
     logger.handlers.clear()
     
     # Create formatter
@@ -43,11 +54,19 @@ def setup_logger(level="INFO", to_file=False, name="strategy", session_id=None):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_file = logs_dir / f"strategy_{timestamp}.log"
         
-        # File handler
-        file_handler = logging.FileHandler(log_file)
+        # Rotating file handler, only opened when the first record is written
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True
+        )
         file_handler.setLevel(getattr(logging, level.upper()))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Batch writes; warnings (and anything above) flush the buffer immediately
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+        )
+        memory_handler.setLevel(getattr(logging, level.upper()))
+        logger.addHandler(memory_handler)
         
         print(f"📝 Logging to file: {log_file}")
     else:
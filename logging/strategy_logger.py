@@ -1,11 +1,24 @@
 """
 Strategy logging utilities for tracking trades and performance.
 """
+import itertools
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from core.utils import now_iso
+
+# orjson is optional; it serializes the full snapshot much faster than the stdlib encoder
+try:
+    import orjson
+
+    def _dump_snapshot(data, pretty):
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, default=str, option=option)
+except ImportError:
+    def _dump_snapshot(data, pretty):
+        return json.dumps(data, indent=2 if pretty else None, default=str).encode("utf-8")
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +38,9 @@ class StrategyLogger:
         self.enabled = enabled
         self.data = {}
         self.log_file = None
+        self.events_file = None
+        self._events_fp = None
+        self._event_seq = itertools.count()  # Orders events that share a timestamp
         self.session_id = session_id
         
         if self.enabled:
@@ -43,9 +59,20 @@ class StrategyLogger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.log_file = logs_dir / f"strategy_log_{timestamp}.json"
         
-        # Initialize data structure
+        # Append-only event log (one JSON record per line) written as events happen
+        self.events_file = self.log_file.with_suffix(".jsonl")
+        
+        self.reset()
+        
+        logger.info("📊 Strategy logging enabled: %s", self.log_file)
+    
+    def reset(self):
+        """Start a fresh data structure for the next execution, keeping the same log files."""
+        if not self.enabled:
+            return
+        
         self.data = {
-            "execution_timestamp": datetime.now().isoformat(),
+            "execution_timestamp": now_iso(),
             "fresh_start": False,
             "buying_power": 0,
             "allowed_symbols": [],
@@ -63,8 +90,23 @@ class StrategyLogger:
                 "total_premium": 0.0
             }
         }
-        
-        logger.info(f"📊 Strategy logging enabled: {self.log_file}")
+    
+    def _append(self, kind: str, payload: Any):
+        """Append a single event record to the JSONL event log."""
+        try:
+            if self._events_fp is None:
+                # Line buffered so every event reaches disk as soon as it is written
+                self._events_fp = open(self.events_file, "a", buffering=1, encoding="utf-8")
+            record = {"timestamp": now_iso(), "seq": next(self._event_seq), "event": kind, "data": payload}
+            self._events_fp.write(json.dumps(record, default=str) + "\n")
+        except Exception as e:
+            logger.error("Failed to append strategy event: %s", e)
+    
+    def close(self):
+        """Close the JSONL event log."""
+        if self._events_fp is not None:
+            self._events_fp.close()
+            self._events_fp = None
     
     def set_fresh_start(self, fresh_start: bool):
         """Set whether this is a fresh start execution."""
@@ -85,26 +127,31 @@ class StrategyLogger:
         """Set the list of filtered symbols after buying power filter."""
         if self.enabled:
             self.data["filtered_symbols"] = symbols
-            logger.info(f"📝 Logged {len(symbols)} filtered symbols: {symbols}")
+            logger.info("📝 Logged %d filtered symbols: %s", len(symbols), symbols)
 
     def add_current_positions(self, positions: List[Any]):
         """Add current position information."""
         if not self.enabled:
             return
             
-        position_data = []
-        for pos in positions:
-            position_data.append({
-                "symbol": pos.symbol,
-                "side": str(pos.side),
-                "qty": float(pos.qty),
-                "avg_entry_price": float(pos.avg_entry_price) if pos.avg_entry_price else None,
-                "current_price": float(pos.current_price) if pos.current_price else None,
-                "unrealized_pl": float(pos.unrealized_pl) if pos.unrealized_pl else None,
-                "market_value": float(pos.market_value) if pos.market_value else None
-            })
-        
-        self.data["current_positions"] = position_data
+        self.data["current_positions"] = [self._position_data(pos) for pos in positions]
+    
+    @staticmethod
+    def _position_data(pos: Any) -> Dict[str, Any]:
+        """Snapshot of a single position; each attribute is read only once."""
+        avg = pos.avg_entry_price
+        cur = pos.current_price
+        upl = pos.unrealized_pl
+        mv = pos.market_value
+        return {
+            "symbol": pos.symbol,
+            "side": str(pos.side),
+            "qty": float(pos.qty),
+            "avg_entry_price": float(avg) if avg else None,
+            "current_price": float(cur) if cur else None,
+            "unrealized_pl": float(upl) if upl else None,
+            "market_value": float(mv) if mv else None
+        }
     
     def add_state_dict(self, state_dict: Dict[str, Any]):
         """Add the strategy state dictionary."""
@@ -115,25 +162,27 @@ class StrategyLogger:
         """Log the available put options."""
         if self.enabled:
             self.data["put_options"] = put_options
-            logger.info(f"📝 Logged {len(put_options)} put options")
+            logger.info("📝 Logged %d put options", len(put_options))
 
     def log_call_options(self, call_options: List[Dict[str, Any]]):
         """Log the available call options."""
         if self.enabled:
             self.data["call_options"] = call_options
-            logger.info(f"📝 Logged {len(call_options)} call options")
+            logger.info("📝 Logged %d call options", len(call_options))
 
     def log_sold_puts(self, sold_puts: List[Dict[str, Any]]):
         """Log the sold put options."""
         if self.enabled:
             self.data["sold_puts"].extend(sold_puts)
-            logger.info(f"📝 Logged {len(sold_puts)} sold puts")
+            self._append("sold_puts", sold_puts)
+            logger.info("📝 Logged %d sold puts", len(sold_puts))
 
     def log_sold_calls(self, sold_call: Dict[str, Any]):
         """Log a sold call option."""
         if self.enabled:
             self.data["sold_calls"].append(sold_call)
-            logger.info(f"📝 Logged sold call: {sold_call.get('symbol', 'Unknown')}")
+            self._append("sold_call", sold_call)
+            logger.info("📝 Logged sold call: %s", sold_call.get('symbol', 'Unknown'))
     
     def log_trade(self, trade_type: str, symbol: str, contract_symbol: str, 
                   strike: float, premium: float, expiry: str, quantity: int = 1):
@@ -153,7 +202,7 @@ class StrategyLogger:
             return
             
         trade_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "type": trade_type.upper(),
             "symbol": symbol,
             "contract_symbol": contract_symbol,
@@ -164,6 +213,7 @@ class StrategyLogger:
         }
         
         self.data["trades"].append(trade_data)
+        self._append("trade", trade_data)
         
         # Update summary
         if trade_type.upper() == "PUT":
@@ -173,21 +223,32 @@ class StrategyLogger:
         
         self.data["summary"]["total_premium"] += premium
         
-        logger.info(f"📝 Logged {trade_type} trade: {symbol} ${strike} for ${premium:.2f}")
+        logger.info("📝 Logged %s trade: %s $%s for $%.2f", trade_type, symbol, strike, premium)
     
-    def save(self):
-        """Save the log data to file."""
+    def save(self, full_snapshot=True, pretty=False):
+        """
+        Finish the log: append a summary record to the event log and close it.
+        
+        Args:
+            full_snapshot (bool): Also write the complete execution data to the JSON log file
+            pretty (bool): Indent the JSON log file for reading by hand
+        """
         if not self.enabled or not self.log_file:
             return
+        
+        self._append("summary", self.data["summary"])
+        self.close()
+        
+        if not full_snapshot:
+            return
             
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self.data, f, indent=2, default=str)
+            self.log_file.write_bytes(_dump_snapshot(self.data, pretty))
             
-            logger.info(f"💾 Strategy log saved: {self.log_file}")
+            logger.info("💾 Strategy log saved: %s", self.log_file)
             
         except Exception as e:
-            logger.error(f"Failed to save strategy log: {e}")
+            logger.error("Failed to save strategy log: %s", e)
     
     def get_summary(self) -> Dict[str, Any]:
         """Get the current execution summary."""
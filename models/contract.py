@@ -50,6 +50,11 @@ class Contract:
         if not snapshot:
             raise ValueError(f"Snapshot data is required to create a Contract from a snapshot for symbol {contract.symbol}.")
         
+        # Resolve each snapshot section once rather than per field
+        greeks = getattr(snapshot, 'greeks', None)
+        latest_quote = getattr(snapshot, 'latest_quote', None)
+        latest_trade = getattr(snapshot, 'latest_trade', None)
+        
         return cls(
             underlying = contract.underlying_symbol,
             symbol = contract.symbol,
@@ -57,10 +62,10 @@ class Contract:
             oi = float(contract.open_interest) if contract.open_interest is not None else None,
             dte = (contract.expiration_date - datetime.date.today()).days,
             strike = contract.strike_price,
-            delta = snapshot.greeks.delta if hasattr(snapshot, 'greeks') and snapshot.greeks else None,
-            bid_price = snapshot.latest_quote.bid_price if hasattr(snapshot, 'latest_quote') and snapshot.latest_quote else None,
-            ask_price = snapshot.latest_quote.ask_price if hasattr(snapshot, 'latest_quote') and snapshot.latest_quote else None,
-            last_price = snapshot.latest_trade.price if hasattr(snapshot, 'latest_trade') and snapshot.latest_trade else None
+            delta = greeks.delta if greeks else None,
+            bid_price = latest_quote.bid_price if latest_quote else None,
+            ask_price = latest_quote.ask_price if latest_quote else None,
+            last_price = latest_trade.price if latest_trade else None
         )
     
     @classmethod
@@ -4,22 +4,72 @@ Demo script to show continuous scheduler functionality without executing real tr
 This is useful for testing the 24/7 automation system.
 """
 
-import time
+import asyncio
 import logging
 from datetime import datetime
-from core.market_hours import MarketHoursChecker, log_market_status
+from core.market_hours import get_checker, log_market_status
 from logging.discord_notifier import DiscordNotifier
 
-def demo_strategy_function():
+async def demo_strategy_function():
     """Mock strategy function that simulates execution without real trades."""
-    print(f"🎯 [DEMO] Strategy execution at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("   📊 This would normally:")
-    print("   - Check current positions")
-    print("   - Analyze market conditions") 
-    print("   - Execute put/call trades")
-    print("   - Update position logs")
-    print("   ✅ Demo execution completed!")
-    time.sleep(2)  # Simulate some processing time
+    print(
+        f"🎯 [DEMO] Strategy execution at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        "   📊 This would normally:\n"
+        "   - Check current positions\n"
+        "   - Analyze market conditions\n"
+        "   - Execute put/call trades\n"
+        "   - Update position logs\n"
+        "   ✅ Demo execution completed!"
+    )
+    await asyncio.sleep(2)  # Simulate some processing time
+
+async def demo_loop(market_checker, discord_notifier, progress):
+    """
+    Run the demo checks, waiting between them without blocking a thread.
+    
+    Args:
+        market_checker (MarketHoursChecker): Checker used for market status
+        discord_notifier (DiscordNotifier): Notifier for demo updates
+        progress (dict): Holds the 'runs' count so it survives an interrupt
+    """
+    loop = asyncio.get_running_loop()
+    max_demo_runs = 3  # Limit demo to 3 iterations
+    
+    while progress["runs"] < max_demo_runs:
+        print(f"\n⏰ Demo Check #{progress['runs'] + 1}")
+        
+        # Market checks are synchronous; keep them off the event loop
+        status = await loop.run_in_executor(None, market_checker.get_market_status)
+        can_trade = status['can_trade_options']
+        
+        print(f"   Market Phase: {status['market_phase']}")
+        print(f"   Can Trade Options: {can_trade}")
+        
+        # Discord sends are queued to the notifier's sender thread, so they
+        # overlap with the next check without awaiting the webhook here
+        if can_trade:
+            print("   ✅ Market is open - executing demo strategy...")
+            await demo_strategy_function()
+            progress["runs"] += 1
+            
+            if discord_notifier.enabled:
+                discord_notifier.send_scheduler_notification(
+                    "execution_complete",
+                    f"🧪 Demo execution #{progress['runs']} completed"
+                )
+        else:
+            print(f"   ⏰ Market closed - next open: {status['next_market_open']}")
+            if discord_notifier.enabled:
+                discord_notifier.send_message(
+                    f"⏰ Demo check: Market closed\n" +
+                    f"Next open: {status['next_market_open']}",
+                    title="🧪 Demo - Market Closed",
+                    color=0xf39c12
+                )
+        
+        if progress["runs"] < max_demo_runs:
+            print("   💤 Waiting 30 seconds for next check...")
+            await asyncio.sleep(30)  # Short interval for demo
 
 def main():
     print("🤖 Options Wheel Bot - 24/7 Automation Demo")
@@ -33,7 +83,7 @@ def main():
     print()
     
     # Initialize components
-    market_checker = MarketHoursChecker()
+    market_checker = get_checker()
     discord_notifier = DiscordNotifier()
     
     print("🔄 Starting demo scheduler...")
@@ -47,47 +97,13 @@ def main():
             "No real trades will be executed."
         )
     
+    progress = {"runs": 0}
     try:
-        run_count = 0
-        max_demo_runs = 3  # Limit demo to 3 iterations
-        
-        while run_count < max_demo_runs:
-            print(f"\n⏰ Demo Check #{run_count + 1}")
-            
-            # Check market status
-            status = market_checker.get_market_status()
-            can_trade = market_checker.can_trade_options()
-            
-            print(f"   Market Phase: {status['market_phase']}")
-            print(f"   Can Trade Options: {can_trade}")
-            
-            if can_trade:
-                print("   ✅ Market is open - executing demo strategy...")
-                demo_strategy_function()
-                run_count += 1
-                
-                if discord_notifier.enabled:
-                    discord_notifier.send_scheduler_notification(
-                        "execution_complete",
-                        f"🧪 Demo execution #{run_count} completed"
-                    )
-            else:
-                print(f"   ⏰ Market closed - next open: {status['next_market_open']}")
-                if discord_notifier.enabled:
-                    discord_notifier.send_message(
-                        f"⏰ Demo check: Market closed\n" +
-                        f"Next open: {status['next_market_open']}",
-                        title="🧪 Demo - Market Closed",
-                        color=0xf39c12
-                    )
-            
-            if run_count < max_demo_runs:
-                print("   💤 Waiting 30 seconds for next check...")
-                time.sleep(30)  # Short interval for demo
-    
+        asyncio.run(demo_loop(market_checker, discord_notifier, progress))
     except KeyboardInterrupt:
         print("\n🛑 Demo interrupted by user")
     
+    run_count = progress["runs"]
     print(f"\n✅ Demo completed! ({run_count} executions)")
     
     if discord_notifier.enabled:
@@ -95,6 +111,7 @@ def main():
             "shutdown",
             f"🧪 Demo completed with {run_count} executions"
         )
+        discord_notifier.flush()
 
 if __name__ == "__main__":
     main()
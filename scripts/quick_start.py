@@ -5,7 +5,6 @@ This script helps users start their fully automated bot with recommended setting
 """
 
 import sys
-import subprocess
 from pathlib import Path
 
 def print_banner():
@@ -86,9 +85,8 @@ def start_bot(settings):
     print("Press Ctrl+C to stop the bot at any time.")
     print()
     
-    # Build command
-    cmd = [
-        sys.executable, "-m", "scripts.run_strategy",
+    # Build arguments for run_strategy
+    argv = [
         "--continuous",
         "--strat-log",
         "--log-to-file",
@@ -97,15 +95,20 @@ def start_bot(settings):
         "--check-interval", str(settings['interval'])
     ]
     
-    print(f"Command: {' '.join(cmd)}")
+    print(f"Command: python -m scripts.run_strategy {' '.join(argv)}")
     print("=" * 50)
     
     try:
-        # Start the bot
-        subprocess.run(cmd, check=True)
+        # Run the bot in this interpreter instead of spawning a second one
+        from scripts import run_strategy
+        run_strategy.main(argv)
     except KeyboardInterrupt:
         print("\n🛑 Bot stopped by user")
-    except subprocess.CalledProcessError as e:
+    except SystemExit as e:
+        # A graceful stop (Ctrl+C / SIGTERM) returns normally; only argument errors exit
+        print(f"\n❌ Bot exited with status {e.code}")
+        return False
+    except Exception as e:
         print(f"\n❌ Bot failed to start: {e}")
         return False
     
@@ -1,24 +1,55 @@
-from pathlib import Path
+import os
+from functools import lru_cache
+from operator import attrgetter
 from core.broker_client import BrokerClient
 from core.execution import sell_puts, sell_calls
 from core.state_manager import update_state, calculate_risk
-from config.credentials import ALPACA_API_KEY, ALPACA_SECRET_KEY, IS_PAPER
+from config.credentials import ALPACA_API_KEY, ALPACA_SECRET_KEY, IS_PAPER, DISCORD_NOTIFICATIONS_ENABLED
 from config.params import MAX_RISK
 from logging.strategy_logger import StrategyLogger
 from logging.logger_setup import setup_logger
 from logging.discord_notifier import DiscordNotifier
 from core.cli_args import parse_args
-from core.market_hours import MarketHoursChecker, log_market_status
+from core.market_hours import get_checker, log_market_status
 from core.continuous_scheduler import ContinuousScheduler
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SYMBOLS_FILE = os.path.join(PROJECT_ROOT, "config", "symbol_list.txt")
+
+# Position fields used for the Discord summary, fetched in one call per position
+_POSITION_FIELDS = attrgetter("symbol", "side", "qty", "avg_entry_price", "current_price", "unrealized_pl")
+
+# (file mtime, symbols, frozenset of symbols) from the last read of SYMBOLS_FILE
+_symbols_cache = (None, [], frozenset())
+
+def load_symbols():
+    """
+    Return the configured symbols as (list, frozenset).
+    
+    The file is only re-read when its modification time changes, so the
+    continuous scheduler pays a stat() per run instead of an open and parse.
+    """
+    global _symbols_cache
+    mtime = os.stat(SYMBOLS_FILE).st_mtime_ns
+    if _symbols_cache[0] != mtime:
+        with open(SYMBOLS_FILE) as f:
+            symbols = f.read().split()
+        _symbols_cache = (mtime, symbols, frozenset(symbols))
+    return _symbols_cache[1], _symbols_cache[2]
+
+@lru_cache(maxsize=1)
+def get_broker_client():
+    """Broker client shared by every strategy run, so API sessions are reused."""
+    return BrokerClient(api_key=ALPACA_API_KEY, secret_key=ALPACA_SECRET_KEY, paper=IS_PAPER)
+
 def test_discord_webhook():
     """Test Discord webhook functionality"""
     print("Testing Discord webhook functionality...")
     
-    # Initialize the Discord notifier
-    notifier = DiscordNotifier()
+    # Only build the notifier when notifications are switched on
+    notifier = DiscordNotifier() if DISCORD_NOTIFICATIONS_ENABLED else None
     
-    if not notifier.enabled:
+    if notifier is None or not notifier.enabled:
         print("❌ Discord notifications are disabled or not configured.")
         print("To enable Discord notifications:")
         print("1. Add DISCORD_WEBHOOK_URL to your .env file")
@@ -26,7 +57,7 @@ def test_discord_webhook():
         return False
     
     print("✅ Discord notifications are enabled")
-    print(f"📡 Webhook URL configured: {notifier.webhook_url[:50]}...")
+    print(f"📡 Webhook URL configured: {notifier.webhook_url_preview}...")
     
     try:
         # Test startup message
@@ -71,7 +102,7 @@ def test_market_hours():
     
     log_market_status()
     
-    checker = MarketHoursChecker()
+    checker = get_checker()
     status = checker.get_market_status()
     
     print("\nDetailed Market Status:")
@@ -80,17 +111,22 @@ def test_market_hours():
     
     print("\n✅ Market hours test completed!")
 
-def execute_strategy_once(args, session_id=None):
-    """Execute the strategy once (extracted for use by scheduler)"""
-    # Initialize loggers and notifier with session_id for consistent file naming
-    strat_logger = StrategyLogger(enabled=args.strat_log, session_id=session_id)
-    logger = setup_logger(level=args.log_level, to_file=args.log_to_file, session_id=session_id)
-    discord_notifier = DiscordNotifier()
-
-    # Check if options trading is allowed
-    market_checker = MarketHoursChecker()
-    if not market_checker.can_trade_options():
-        status = market_checker.get_market_status()
+def execute_strategy_once(args, session_id=None, logger=None, strat_logger=None, discord_notifier=None):
+    """
+    Execute the strategy once (extracted for use by scheduler).
+    
+    The continuous scheduler passes in its logger, strategy logger and notifier so
+    they are built once per session; anything not given is created for this run.
+    """
+    # Initialize logger and notifier with session_id for consistent file naming
+    if logger is None:
+        logger = setup_logger(level=args.log_level, to_file=args.log_to_file, session_id=session_id)
+    if discord_notifier is None:
+        discord_notifier = DiscordNotifier()
+
+    # Check if options trading is allowed before any per-run setup
+    status = get_checker().get_market_status()
+    if not status['can_trade_options']:
         message = f"⏰ Options trading not allowed at this time\n"
         message += f"Market Phase: {status['market_phase']}\n"
         message += f"Next Market Open: {status['next_market_open']}"
@@ -103,13 +139,21 @@ def execute_strategy_once(args, session_id=None):
         
         return False  # Indicate that strategy was not executed
 
+    if strat_logger is None:
+        strat_logger = StrategyLogger(enabled=args.strat_log, session_id=session_id)
+    else:
+        strat_logger.reset()
     strat_logger.set_fresh_start(args.fresh_start)
 
-    SYMBOLS_FILE = Path(__file__).parent.parent / "config" / "symbol_list.txt"
-    with open(SYMBOLS_FILE, 'r') as file:
-        SYMBOLS = [line.strip() for line in file.readlines()]
+    # Trade helpers skip notification work entirely when given None
+    trade_notifier = discord_notifier if discord_notifier.enabled else None
+
+    SYMBOLS, SYMBOLS_SET = load_symbols()
+
+    client = get_broker_client()
 
-    client = BrokerClient(api_key=ALPACA_API_KEY, secret_key=ALPACA_SECRET_KEY, paper=IS_PAPER)
+    # Track trades for summary
+    trades_summary = {"puts_sold": 0, "calls_sold": 0, "total_premium": 0.0}
 
     try:
         if args.fresh_start:
@@ -120,31 +164,34 @@ def execute_strategy_once(args, session_id=None):
             buying_power = MAX_RISK
         else:
             positions = client.get_positions()
-            strat_logger.add_current_positions(positions)            # Send position update to Discord
+            
+            # Queue the position update first; the notifier's sender thread posts it
+            # while the logging and risk/state computation below run
             if positions:
                 positions_summary = [
                     {
-                        "symbol": pos.symbol,
-                        "side": pos.side.title().lower(),
-                        "qty": pos.qty,
-                        "purchase_price": float(pos.avg_entry_price) if pos.avg_entry_price else 0.0,
-                        "current_price": float(pos.current_price) if pos.current_price else 0.0,
-                        "pnl": float(pos.unrealized_pl) if pos.unrealized_pl else 0.0
+                        "symbol": symbol,
+                        "side": side.title().lower(),
+                        "qty": qty,
+                        "purchase_price": float(avg_price) if avg_price else 0.0,
+                        "current_price": float(cur_price) if cur_price else 0.0,
+                        "pnl": float(pnl) if pnl else 0.0
                     }
-                    for pos in positions
+                    for symbol, side, qty, avg_price, cur_price, pnl in map(_POSITION_FIELDS, positions)
                 ]
                 discord_notifier.send_position_update(positions_summary)
 
+            strat_logger.add_current_positions(positions)
             current_risk = calculate_risk(positions)
             
             states = update_state(positions)
             strat_logger.add_state_dict(states)
 
-            for symbol, state in states.items():
-                if state["type"] == "long_shares":
-                    sell_calls(client, symbol, state["price"], state["qty"], strat_logger, discord_notifier)
+            long_shares = [(symbol, state) for symbol, state in states.items() if state["type"] == "long_shares"]
+            for symbol, state in long_shares:
+                sell_calls(client, symbol, state["price"], state["qty"], strat_logger, trade_notifier, trades_summary)
 
-            allowed_symbols = list(set(SYMBOLS).difference(states.keys()))
+            allowed_symbols = list(SYMBOLS_SET - states.keys())
             buying_power = MAX_RISK - current_risk
 
             # Send startup message for regular mode
@@ -155,10 +202,7 @@ def execute_strategy_once(args, session_id=None):
 
         logger.info(f"Current buying power is ${buying_power}")
         
-        # Track trades for summary
-        trades_summary = {"puts_sold": 0, "calls_sold": 0, "total_premium": 0.0}
-        
-        sell_puts(client, allowed_symbols, buying_power, strat_logger, discord_notifier, trades_summary)
+        sell_puts(client, allowed_symbols, buying_power, strat_logger, trade_notifier, trades_summary)
 
         # Send completion notification
         discord_notifier.send_completion_message(trades_summary)
@@ -168,11 +212,20 @@ def execute_strategy_once(args, session_id=None):
 
     except Exception as e:
         logger.error(f"Error during strategy execution: {e}")
+        if getattr(e, "status_code", None) in (401, 403):
+            # Rejected credentials: build a fresh client on the next run
+            get_broker_client.cache_clear()
         discord_notifier.send_error_notification(str(e), "Strategy execution")
         raise
+    finally:
+        # Deliver this run's queued notifications (sent in batches) before returning
+        discord_notifier.flush()
+        # Write this run's buffered log records, so a long idle spell can't hold them
+        for handler in logger.handlers:
+            handler.flush()
 
-def main():
-    args = parse_args()
+def main(argv=None):
+    args = parse_args(argv)
     
     # If testing Discord, run test and exit
     if args.test_discord:
@@ -192,12 +245,19 @@ def main():
         logger = setup_logger(level=args.log_level, to_file=args.log_to_file, session_id=session_id)
         logger.info("Starting Options Wheel Bot in continuous 24/7 mode...")
         
+        # Built once and shared by every scheduled run
+        strat_logger = StrategyLogger(enabled=args.strat_log, session_id=session_id)
+        discord_notifier = DiscordNotifier()
+        
         # Create and start the continuous scheduler
         scheduler = ContinuousScheduler(
-            strategy_function=lambda: execute_strategy_once(args, session_id=session_id),
+            strategy_function=lambda: execute_strategy_once(
+                args, session_id=session_id, logger=logger,
+                strat_logger=strat_logger, discord_notifier=discord_notifier
+            ),
             check_interval_minutes=args.check_interval,
             max_runs_per_day=args.max_runs_per_day,
-            discord_notifier=DiscordNotifier()
+            discord_notifier=discord_notifier if discord_notifier.enabled else None
         )
         
         try:
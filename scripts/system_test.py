@@ -56,9 +56,9 @@ def test_market_hours():
     print("\n⏰ Testing market hours...")
     
     try:
-        from core.market_hours import MarketHoursChecker
+        from core.market_hours import get_checker
         
-        checker = MarketHoursChecker()
+        checker = get_checker()
         status = checker.get_market_status()
         
         print(f"  📅 Current time (ET): {status['current_time_et']}")
@@ -80,13 +80,16 @@ def test_discord():
     print("\n📱 Testing Discord integration...")
     
     try:
-        from logging.discord_notifier import DiscordNotifier
+        from config.credentials import DISCORD_NOTIFICATIONS_ENABLED
         
-        notifier = DiscordNotifier()
+        notifier = None
+        if DISCORD_NOTIFICATIONS_ENABLED:
+            from logging.discord_notifier import DiscordNotifier
+            notifier = DiscordNotifier()
         
-        if notifier.enabled:
+        if notifier is not None and notifier.enabled:
             print("  ✅ Discord notifications enabled")
-            print(f"  🔗 Webhook configured: {notifier.webhook_url[:50]}...")
+            print(f"  🔗 Webhook configured: {notifier.webhook_url_preview}...")
             
             # Test sending a message
             try:
@@ -116,8 +119,7 @@ def test_symbol_list():
         symbols_file = Path("config/symbol_list.txt")
         
         if symbols_file.exists():
-            with open(symbols_file, 'r') as f:
-                symbols = [line.strip() for line in f.readlines() if line.strip()]
+            symbols = symbols_file.read_text().split()
             
             print(f"  ✅ Symbol list found with {len(symbols)} symbols")
             print(f"  📊 Symbols: {', '.join(symbols[:5])}{' ...' if len(symbols) > 5 else ''}")
@@ -142,11 +144,7 @@ def test_cli_args():
         from core.cli_args import parse_args
         
         # Test with no arguments (should use defaults)
-        import sys
-        original_argv = sys.argv.copy()
-        sys.argv = ['test']  # Simulate script name only
-        
-        args = parse_args()
+        args = parse_args([])
         
         # Check that new arguments exist
         required_attrs = ['continuous', 'check_interval', 'max_runs_per_day', 'test_market_hours']
@@ -160,9 +158,6 @@ def test_cli_args():
         print(f"  ⚙️  Default check interval: {args.check_interval} minutes")
         print(f"  🎯 Default max runs per day: {args.max_runs_per_day}")
         
-        # Restore original argv
-        sys.argv = original_argv
-        
         return True
         
     except Exception as e:
@@ -171,6 +166,11 @@ def test_cli_args():
 
 def main():
     """Run complete system test."""
+    # The report is read once it's complete, so let stdout fill its buffer instead of
+    # issuing a write per line on a terminal; everything is flushed at exit
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("🤖 Options Wheel Bot - Complete System Test")
     print("=" * 60)
     print("This script validates that your 24/7 automation setup is ready.")
@@ -1,75 +1,168 @@
 # Test script for Discord webhook functionality
-# Run this script to test if your Discord webhook is working correctly
+# Run this script to test if your Discord webhook is working correctly:
+#     python -m scripts.test_discord          # offline: checks the payloads, no network
+#     python -m scripts.test_discord --live   # posts the test messages to your webhook
+#     python -m scripts.test_discord --live --send startup   # posts just one of them
 
+import argparse
 import sys
-import os
-from pathlib import Path
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from config.credentials import DISCORD_NOTIFICATIONS_ENABLED
 
-from logging.discord_notifier import DiscordNotifier
+def _send_startup(notifier):
+    print("📤 Sending test startup message...")
+    notifier.send_startup_message(
+        fresh_start=True,
+        buying_power=100000,
+        allowed_symbols=["AAPL", "NVDA", "TSLA"]
+    )
 
-def test_discord_webhook():
+def _send_trade(notifier):
+    print("📤 Sending test trade notification...")
+    notifier.send_embed(notifier.build_trade_embed(
+        trade_type="PUT",
+        symbol="AAPL",
+        contract_symbol="AAPL250620P00200000",
+        strike=200.0,
+        premium=5.50,
+        expiry="14 days"
+    ))
+
+def _send_completion(notifier):
+    print("📤 Sending test completion message...")
+    notifier.send_completion_message({
+        "puts_sold": 3,
+        "calls_sold": 1,
+        "total_premium": 850.00
+    })
+
+def _send_insufficient(notifier):
+    print("📤 Sending test insufficient funds notification...")
+    notifier.send_insufficient_funds_notification(
+        symbol="AAPL",
+        required_amount=20000.00,
+        available_amount=15000.00
+    )
+
+# --send choice -> test message sender (one embed each)
+TEST_MESSAGES = {
+    "startup": _send_startup,
+    "trade": _send_trade,
+    "completion": _send_completion,
+    "insufficient": _send_insufficient,
+}
+
+def _selected(send):
+    """Names of the test messages selected by --send."""
+    return list(TEST_MESSAGES) if send == "all" else [send]
+
+def _queue_test_messages(notifier, names):
+    """Queue the named notifications, collected into a single webhook post."""
+    with notifier.batched():
+        for name in names:
+            TEST_MESSAGES[name](notifier)
+
+def test_discord_payloads(send="all"):
+    """Build the test notifications with a dry-run notifier and check the payload"""
+    print("Testing Discord payloads (offline)...")
+
+    from logging.discord_notifier import DiscordNotifier
+
+    # Dry run: payloads are collected instead of posted, so no webhook is needed
+    payloads = []
+    notifier = DiscordNotifier(enabled=True, transport=payloads.append)
+
+    names = _selected(send)
+    _queue_test_messages(notifier, names)
+    notifier.flush()
+    posted = list(payloads)
+
+    # A run with no trades must not post anything
+    payloads.clear()
+    notifier.send_completion_message({"puts_sold": 0, "calls_sold": 0, "total_premium": 0})
+    notifier.flush()
+    if payloads:
+        print("❌ Empty completion summary was posted")
+        return False
+
+    embeds = [embed for payload in posted for embed in payload["embeds"]]
+    if len(posted) != 1 or len(embeds) != len(names):
+        print(f"❌ Expected {len(names)} embeds in 1 post, got {len(embeds)} in {len(posted)}")
+        return False
+
+    missing = [embed for embed in embeds if not embed.get("description") or "timestamp" not in embed]
+    if missing:
+        print(f"❌ {len(missing)} embed(s) missing a description or timestamp")
+        return False
+
+    print(f"✅ {len(embeds)} embeds built and batched into a single webhook post")
+    print("ℹ️  Run with --live to send them to your Discord channel.")
+    return True
+
+def test_discord_webhook(send="all"):
     """Test Discord webhook functionality"""
     print("Testing Discord webhook functionality...")
-    
-    # Initialize the Discord notifier
-    notifier = DiscordNotifier()
-    
-    if not notifier.enabled:
+
+    notifier = None
+    if DISCORD_NOTIFICATIONS_ENABLED:
+        # Only load the notifier (and its HTTP stack) when it will be used
+        from logging.discord_notifier import DiscordNotifier
+        notifier = DiscordNotifier()
+
+    if notifier is None or not notifier.enabled:
         print("❌ Discord notifications are disabled or not configured.")
         print("To enable Discord notifications:")
         print("1. Add DISCORD_WEBHOOK_URL to your .env file")
         print("2. Set DISCORD_NOTIFICATIONS_ENABLED=true in your .env file")
         return False
-    
+
     print("✅ Discord notifications are enabled")
-    print(f"📡 Webhook URL configured: {notifier.webhook_url[:50]}...")
-    
+    print(f"📡 Webhook URL configured: {notifier.webhook_url_preview}...")
+
     try:
-        # Test startup message
-        print("📤 Sending test startup message...")
-        notifier.send_startup_message(
-            fresh_start=True, 
-            buying_power=100000, 
-            allowed_symbols=["AAPL", "NVDA", "TSLA"]
-        )
-        
-        # Test trade notification
-        print("📤 Sending test trade notification...")
-        notifier.send_trade_notification(
-            trade_type="PUT",
-            symbol="AAPL",
-            contract_symbol="AAPL250620P00200000",
-            strike=200.0,
-            premium=5.50,
-            expiry="14 days"
-        )
-          # Test completion message
-        print("📤 Sending test completion message...")
-        notifier.send_completion_message({
-            "puts_sold": 3,
-            "calls_sold": 1,
-            "total_premium": 850.00
-        })
-        
-        # Test insufficient funds notification
-        print("📤 Sending test insufficient funds notification...")
-        notifier.send_insufficient_funds_notification(
-            symbol="AAPL",
-            required_amount=20000.00,
-            available_amount=15000.00
-        )
-        
+        _queue_test_messages(notifier, _selected(send))
+        sys.stdout.flush()  # Show progress before waiting on the network
+
+        if not notifier.flush(timeout=15):
+            print("❌ Timed out waiting for the messages to be delivered")
+            return False
+
+        if notifier.failed_embeds:
+            print(f"❌ {notifier.failed_embeds} message(s) were not delivered: {notifier.last_error}")
+            return False
+
         print("✅ All test messages sent successfully!")
         print("📱 Check your Discord channel to see if the messages appeared.")
         return True
-        
+
     except Exception as e:
         print(f"❌ Error sending Discord messages: {e}")
         return False
 
+def main():
+    parser = argparse.ArgumentParser(description="Test Discord notifications")
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Send the test messages to the configured webhook instead of checking them offline"
+    )
+    parser.add_argument(
+        "--send",
+        choices=[*TEST_MESSAGES, "all"],
+        default="all",
+        help="Which test message to send (default: all)"
+    )
+
+    args = parser.parse_args()
+
+    # Let stdout fill its buffer instead of writing every line separately; flushed at exit
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    if args.live:
+        test_discord_webhook(args.send)
+    else:
+        test_discord_payloads(args.send)
+
 if __name__ == "__main__":
-    test_discord_webhook()
+    main()
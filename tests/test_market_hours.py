@@ -0,0 +1,26 @@
+"""
+Tests for core.market_hours time-until-open calculations.
+"""
+import datetime
+
+from core.market_hours import MarketHoursChecker
+
+UTC = datetime.timezone.utc
+
+
+def test_time_until_open_across_spring_forward():
+    # Friday 2024-03-08 10:42 EST; Monday's 09:30 open is EDT, an hour less away
+    checker = MarketHoursChecker()
+    dt = datetime.datetime(2024, 3, 8, 15, 42, tzinfo=UTC)
+
+    assert checker.get_time_until_market_open(dt) == datetime.timedelta(days=2, hours=21, minutes=48)
+    assert checker.get_market_status(dt)['time_until_market_open'] == "2 days, 21:48:00"
+
+
+def test_time_until_open_across_fall_back():
+    # Friday 2024-11-01 13:13:47 EDT; Monday's 09:30 open is EST, an hour more away
+    checker = MarketHoursChecker()
+    dt = datetime.datetime(2024, 11, 1, 17, 13, 47, tzinfo=UTC)
+
+    assert checker.get_time_until_market_open(dt) == datetime.timedelta(days=2, hours=21, minutes=16, seconds=13)
+